@@ -0,0 +1,8 @@
+"""Autonomous AI agents for the full development lifecycle.
+
+Subpackages:
+- ``agents.core`` - Base agent implementations and shared functionality
+- ``agents.llm`` - LLM service integrations (GPT-5, Claude 4.1)
+- ``agents.tools`` - Agent tool implementations (web search, semantic search, ...)
+- ``agents.workflows`` - Multi-step agent operations backed by Convex Workflows
+"""
@@ -0,0 +1 @@
+"""Base agent implementations and shared functionality."""
@@ -0,0 +1,292 @@
+"""Coordinates multi-agent work on a single project.
+
+The coordinator owns the registered agents for one project, assigns
+coordination tasks to the agent types a task requires, and fans the work
+out. Agent LLM calls are independent I/O, so agents working the same task
+run concurrently: task latency is max(agents), not sum(agents). Tasks that
+declare dependencies wait on the completion events of those tasks first,
+so dependency chains still execute in order while independent leaves
+overlap.
+"""
+
+import asyncio
+import functools
+import logging
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from .base_agent import BaseAgent
+
+
+@dataclass(slots=True, frozen=True)
+class CoordinationTask:
+    """One unit of multi-agent work."""
+
+    task_id: str
+    task_type: str
+    project_id: str
+    required_agent_types: List[str]
+    context: Dict[str, Any] = field(default_factory=dict)
+    priority: str = "normal"
+    dependencies: List[str] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=256)
+def _coordinator_logger(project_id: str) -> logging.Logger:
+    return logging.getLogger(f"coordinator.{project_id}")
+
+
+# Dispatch order for queued tasks; lower rank runs first.
+_PRIORITY_RANK = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+
+# How many completed task IDs to remember for dependency checks. Bounds
+# the coordinator's footprint over a long-lived project; dependents of a
+# task normally arrive while it is pending or shortly after it finishes,
+# both well inside this window.
+_DONE_MEMORY = 4096
+
+
+class AgentCoordinator:
+    """Registers agents and dispatches coordination tasks to them.
+
+    Tasks flow through an ``asyncio.PriorityQueue`` drained by a pool of
+    ``max_concurrent_tasks`` workers, so concurrent ``assign_task`` callers
+    enqueue without racing, higher-priority tasks jump the line, and
+    ``queue_maxsize`` bounds memory by applying back-pressure to producers.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        max_concurrent_tasks: int = 5,
+        queue_maxsize: int = 0,
+    ) -> None:
+        self.project_id = project_id
+        self.max_concurrent_tasks = max_concurrent_tasks
+        self.active_agents: Dict[str, BaseAgent] = {}
+        # Secondary index: agents grouped by type for O(1) lookup, plus a
+        # per-type cursor for round-robin selection among same-type agents.
+        self._by_type: Dict[str, List[BaseAgent]] = defaultdict(list)
+        self._rr_index: Dict[str, int] = {}
+        self._validator_is_sync: Dict[str, bool] = {}
+        self.task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(
+            maxsize=queue_maxsize
+        )
+        self._seq = 0  # FIFO tie-break within a priority class
+        self._workers: List[asyncio.Task] = []
+        # Completion events for pending/in-flight tasks only; finished
+        # tasks move to the bounded _done_ids set so the dict does not
+        # grow for the life of the coordinator.
+        self._task_done: Dict[str, asyncio.Event] = {}
+        self._done_ids: OrderedDict[str, None] = OrderedDict()
+        self.logger = _coordinator_logger(project_id)
+
+    def register_agent(self, agent: BaseAgent) -> None:
+        self.active_agents[agent.config.agent_id] = agent
+        self._by_type[agent.config.agent_type].append(agent)
+        # Agents that keep the base validate_output get the sync fast path:
+        # no coroutine allocation or event-loop tick per validation.
+        self._validator_is_sync[agent.config.agent_id] = (
+            type(agent).validate_output is BaseAgent.validate_output
+        )
+        self.logger.info(
+            "Registered agent %s (%s)",
+            agent.config.agent_id,
+            agent.config.agent_type,
+        )
+
+    def unregister_agent(self, agent_id: str) -> None:
+        agent = self.active_agents.pop(agent_id, None)
+        if agent is None:
+            return
+        agent_type = agent.config.agent_type
+        siblings = self._by_type[agent_type]
+        siblings.remove(agent)
+        if not siblings:
+            del self._by_type[agent_type]
+            self._rr_index.pop(agent_type, None)
+        self._validator_is_sync.pop(agent_id, None)
+        self.logger.info("Unregistered agent %s (%s)", agent_id, agent_type)
+
+    def _find_agent_by_type(self, agent_type: str) -> Optional[BaseAgent]:
+        """O(1) type lookup, round-robin among same-type agents."""
+        agents = self._by_type.get(agent_type)
+        if not agents:
+            return None
+        index = self._rr_index.get(agent_type, 0) % len(agents)
+        self._rr_index[agent_type] = index + 1
+        return agents[index]
+
+    async def assign_task(self, task: CoordinationTask) -> List[Dict[str, Any]]:
+        """Enqueue ``task`` and await its results from the worker pool.
+
+        Dependencies are waited on here, in the submitter, before the
+        task enters the queue. Workers therefore never block on work
+        that is still queued - a high-priority task that outranks its
+        own dependency would otherwise occupy a worker forever waiting
+        for a dependency the pool no longer has capacity to run.
+        """
+        agents = []
+        for agent_type in task.required_agent_types:
+            agent = self._find_agent_by_type(agent_type)
+            if agent is None:
+                raise ValueError(
+                    f"No registered agent of type {agent_type} "
+                    f"for task {task.task_id}"
+                )
+            agents.append(agent)
+
+        self._ensure_workers()
+        await self._wait_for_dependencies(task)
+        # setdefault: a dependent that declared this task first already
+        # created the event; completing reuses it so that waiter wakes.
+        self._task_done.setdefault(task.task_id, asyncio.Event())
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        rank = _PRIORITY_RANK.get(task.priority, _PRIORITY_RANK["normal"])
+        self._seq += 1
+        await self.task_queue.put((rank, self._seq, task, agents, future))
+        self.logger.info("Assigned task %s to %d agents", task.task_id, len(agents))
+        return await future
+
+    def _ensure_workers(self) -> None:
+        """Start the worker pool on first use (needs a running loop)."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"coordinator-worker-{i}")
+            for i in range(self.max_concurrent_tasks)
+        ]
+
+    async def _wait_for_dependencies(self, task: CoordinationTask) -> None:
+        """Block until every declared dependency has completed.
+
+        A dependency that has not been assigned yet gets its completion
+        event created here, so the dependent genuinely waits for it
+        instead of racing ahead - declaring a dependency ID that is
+        never assigned leaves the dependent waiting, by design.
+        """
+        for dep_id in task.dependencies:
+            if dep_id in self._done_ids:
+                continue
+            event = self._task_done.setdefault(dep_id, asyncio.Event())
+            await event.wait()
+
+    def _mark_done(self, task_id: str) -> None:
+        """Wake dependents and remember the completion, boundedly."""
+        event = self._task_done.pop(task_id, None)
+        if event is not None:
+            event.set()
+        self._done_ids[task_id] = None
+        self._done_ids.move_to_end(task_id)
+        while len(self._done_ids) > _DONE_MEMORY:
+            self._done_ids.popitem(last=False)
+
+    async def _worker(self) -> None:
+        """Drain the priority queue, one task at a time per worker."""
+        while True:
+            _, _, task, agents, future = await self.task_queue.get()
+            try:
+                results = await self._coordinate_agents(agents, task)
+                if not future.cancelled():
+                    future.set_result(results)
+            except BaseException as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+            finally:
+                self._mark_done(task.task_id)
+                self.task_queue.task_done()
+
+    async def shutdown(self) -> None:
+        """Stop the worker pool; queued tasks are abandoned."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _coordinate_agents(
+        self, agents: List[BaseAgent], task: CoordinationTask
+    ) -> List[Dict[str, Any]]:
+        """Run every agent against ``task`` concurrently.
+
+        Dependencies were already waited out in ``assign_task`` before
+        the task was queued; here all agents run in parallel. A failure
+        in one agent is reported in its result slot rather than
+        aborting the batch.
+        """
+        # One shared read-only payload for every agent: no per-agent dict
+        # copy, and task.context (which can carry large RAG results) is
+        # referenced, never duplicated. Agents that need a private mutable
+        # copy must take dict(payload) themselves.
+        payload: Mapping[str, Any] = MappingProxyType(
+            {
+                "task_id": task.task_id,
+                "project_id": task.project_id,
+                "task_type": task.task_type,
+                "context": task.context,
+            }
+        )
+        outcomes = await asyncio.gather(
+            *[self._run_one(agent, task, payload) for agent in agents],
+            return_exceptions=True,
+        )
+        results: List[Dict[str, Any]] = []
+        for agent, outcome in zip(agents, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.error(
+                    "Agent %s raised on task %s: %s",
+                    agent.config.agent_id,
+                    task.task_id,
+                    outcome,
+                )
+                outcome = {
+                    "status": "error",
+                    "result": None,
+                    "error": str(outcome),
+                    "agent_id": agent.config.agent_id,
+                }
+            results.append(outcome)
+        return results
+
+    async def _run_one(
+        self,
+        agent: BaseAgent,
+        task: CoordinationTask,
+        payload: Mapping[str, Any],
+    ) -> Dict[str, Any]:
+        """Log, execute and validate one agent's share of a task."""
+        agent.log_action("process_task", {"task_id": task.task_id})
+        try:
+            result = await agent.process_task(payload)
+        except ValueError as exc:
+            self.logger.error(
+                "Agent %s failed task %s: %s",
+                agent.config.agent_id,
+                task.task_id,
+                exc,
+            )
+            return {
+                "status": "error",
+                "result": None,
+                "error": str(exc),
+                "agent_id": agent.config.agent_id,
+            }
+        if self._validator_is_sync.get(agent.config.agent_id, False):
+            valid = agent._validate_sync(result)
+        else:
+            valid = await agent.validate_output(result)
+        if not valid:
+            self.logger.warning(
+                "Agent %s produced invalid output for task %s",
+                agent.config.agent_id,
+                task.task_id,
+            )
+            return {
+                "status": "invalid",
+                "result": result,
+                "agent_id": agent.config.agent_id,
+            }
+        return {**result, "agent_id": agent.config.agent_id}
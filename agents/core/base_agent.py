@@ -0,0 +1,142 @@
+"""Base agent shared by the seven development-lifecycle agent types.
+
+Concrete agents (ProjectManager, SystemArchitect, TaskPlanner, CodeGenerator,
+TestEngineer, QAAnalyst, DeploymentEngineer) subclass ``BaseAgent`` and
+implement ``process_task``. Everything else - state tracking, output
+validation, action logging and RAG context retrieval - is shared here.
+"""
+
+import functools
+import logging
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, List, Mapping, Optional
+
+from .rag_cache import shared_embedding_cache
+
+
+@functools.lru_cache(maxsize=256)
+def _agent_logger(agent_type: str) -> logging.Logger:
+    """One logger per agent type, not per instance.
+
+    Thousands of agents would otherwise each take the logging.Manager lock
+    to create their own logger; the agent id travels in the record's extra
+    fields instead of the logger name.
+    """
+    return logging.getLogger(f"agent.{agent_type}")
+
+
+@dataclass(slots=True, frozen=True)
+class AgentConfig:
+    """Identity and limits for one agent instance."""
+
+    agent_id: str
+    agent_type: str
+    project_id: str
+    capabilities: List[str] = field(default_factory=list)
+    max_retries: int = 3
+
+
+class BaseAgent:
+    """Common behaviour for all lifecycle agents.
+
+    ``state`` is a plain mutable dict owned by the agent. Writers go through
+    ``update_state`` (O(1) in-place assignment); readers that need a stable
+    view take ``snapshot_state()``, a zero-copy read-only proxy.
+    """
+
+    # Slots keep per-instance overhead low when a coordinator holds
+    # thousands of agents; subclasses adding attributes declare their own.
+    __slots__ = ("config", "state", "logger")
+
+    # Keys every agent output must carry. Subclasses may extend this with
+    # e.g. ``_REQUIRED_KEYS | {"artifacts"}``.
+    _REQUIRED_KEYS: ClassVar[FrozenSet[str]] = frozenset({"status", "result"})
+
+    def __init__(self, config: AgentConfig) -> None:
+        self.config = config
+        self.state: Dict[str, Any] = {}
+        self.logger = _agent_logger(config.agent_type)
+
+    def update_state(self, key: str, value: Any) -> None:
+        """Set one state entry in place."""
+        self.state[key] = value
+
+    def get_state(self, key: str, default: Any = None) -> Any:
+        return self.state.get(key, default)
+
+    def snapshot_state(self) -> Mapping[str, Any]:
+        """Read-only live view of the state dict, without copying it."""
+        return MappingProxyType(self.state)
+
+    async def process_task(self, task: Mapping[str, Any]) -> Dict[str, Any]:
+        """Execute one coordination task. Implemented by each agent type."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement process_task"
+        )
+
+    async def validate_output(self, output: Dict[str, Any]) -> bool:
+        """Check that an agent's output carries the required envelope.
+
+        Async so subclasses can validate with I/O (test runs, RAG lookups).
+        Agents that do not override this are detected at registration time
+        and the coordinator calls ``_validate_sync`` directly, skipping the
+        coroutine round-trip.
+        """
+        return self._validate_sync(output)
+
+    def _validate_sync(self, output: Dict[str, Any]) -> bool:
+        """Synchronous fast path for the base envelope check."""
+        return self._REQUIRED_KEYS.issubset(output)
+
+    def log_action(self, action: str, details: Optional[Dict[str, Any]] = None) -> None:
+        """Record one agent action for audit and debugging.
+
+        Guarded so that when INFO is filtered out (production default) the
+        call costs one level check - no string formatting, no extra-dict
+        allocation - at tens of thousands of actions per second.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        extra = {"agent_id": self.config.agent_id}
+        if details:
+            extra.update(details)
+        self.logger.info(
+            "Agent %s performing %s",
+            self.config.agent_id,
+            action,
+            extra=extra,
+        )
+
+    async def get_context_from_rag(self, query: str) -> Dict[str, Any]:
+        """Retrieve relevant context for ``query``.
+
+        Both stages are served from the process-wide cache shared by all
+        agents: repeated or paraphrase-heavy queries skip re-embedding, and
+        exact repeats skip the vector search too (until the corpus changes).
+        """
+        cached = await shared_embedding_cache.get_results(query)
+        if cached is not None:
+            return cached
+        embedding = await shared_embedding_cache.get_or_embed(
+            query, self._embed_query
+        )
+        context = await self._search_rag(embedding, query)
+        await shared_embedding_cache.put_results(query, context)
+        return context
+
+    async def _embed_query(self, text: str) -> Any:
+        """Embed ``text`` for vector search.
+
+        Placeholder: production goes through the Convex RAG component's
+        embedder for the project namespace.
+        """
+        return text
+
+    async def _search_rag(self, embedding: Any, query: str) -> Dict[str, Any]:
+        """Vector-search the project corpus.
+
+        Placeholder: production searches the Convex RAG component index
+        with ``embedding`` (top-5 by cosine similarity).
+        """
+        return {"query": query, "results": [], "total_results": 0}
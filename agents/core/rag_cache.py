@@ -0,0 +1,97 @@
+"""Process-wide embedding and retrieval caches for RAG context lookups.
+
+Agents in one process ask many near-identical questions: every lifecycle
+agent embeds queries about the same project. Re-embedding each call
+dominates RAG cost when the embedder is local, so embeddings are cached
+across all agents, keyed on a SHA-256 of the query text. A second cache
+keyed the same way skips the vector search itself for repeated queries;
+it is dropped wholesale when the corpus changes (``invalidate_corpus``),
+while embeddings survive - they depend only on the query text.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+Embedder = Callable[[str], Awaitable[Any]]
+
+
+class SharedEmbeddingCache:
+    """LRU caches for query embeddings and retrieval results.
+
+    One instance (``shared_embedding_cache``) is shared by every agent in
+    the process. 10k cached 768-d float32 embeddings cost roughly 30 MB.
+    """
+
+    def __init__(self, max_embeddings: int = 10_000, max_results: int = 2_048) -> None:
+        self.max_embeddings = max_embeddings
+        self.max_results = max_results
+        self._embeddings: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._results: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._corpus_version = 0
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    async def get_or_embed(self, text: str, embedder: Embedder) -> Any:
+        """Return the cached embedding for ``text``, embedding on miss.
+
+        The embedder runs outside the lock; concurrent misses on the same
+        text may embed twice, which is harmless and keeps hits uncontended.
+        """
+        key = self._key(text)
+        async with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is not None:
+                self._embeddings.move_to_end(key)
+                self._hits += 1
+                return embedding
+            self._misses += 1
+        embedding = await embedder(text)
+        async with self._lock:
+            self._embeddings[key] = embedding
+            while len(self._embeddings) > self.max_embeddings:
+                self._embeddings.popitem(last=False)
+        return embedding
+
+    async def get_results(self, text: str) -> Optional[Any]:
+        """Cached retrieval results for ``text``, if the corpus is unchanged."""
+        key = self._key(text)
+        async with self._lock:
+            results = self._results.get(key)
+            if results is not None:
+                self._results.move_to_end(key)
+            return results
+
+    async def put_results(self, text: str, results: Any) -> None:
+        key = self._key(text)
+        async with self._lock:
+            self._results[key] = results
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+    def invalidate_corpus(self) -> None:
+        """Drop retrieval results after the indexed corpus changes.
+
+        Embeddings stay: they are a function of the query text alone.
+        """
+        self._corpus_version += 1
+        self._results.clear()
+
+    def stats(self) -> dict:
+        total = self._hits + self._misses
+        return {
+            "embeddings": len(self._embeddings),
+            "results": len(self._results),
+            "corpus_version": self._corpus_version,
+            "hit_rate": self._hits / total if total else 0.0,
+        }
+
+
+# Shared by every agent in the process.
+shared_embedding_cache = SharedEmbeddingCache()
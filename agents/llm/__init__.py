@@ -0,0 +1,6 @@
+"""LLM service integrations for agent workloads (GPT-5, Claude 4.1).
+
+Modules are imported directly (``from agents.llm.gpt_integration import ...``)
+rather than re-exported here, so importing the package does not pull in
+provider SDKs that a given deployment may not need.
+"""
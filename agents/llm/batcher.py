@@ -0,0 +1,91 @@
+"""Micro-batching coalescer for concurrent LLM calls.
+
+Under high agent fan-out many ``generate_response`` calls arrive within the
+same few milliseconds. Issuing one HTTP round-trip per prompt pays
+per-request overhead (connection scheduling, rate-limit accounting, context
+switches) N times; collecting concurrent prompts for a short window and
+sending them as one batched request pays it once. Callers still see a plain
+``await submit(item) -> result`` - batching is invisible to them.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+FlushFn = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class AsyncBatcher:
+    """Collects concurrent items and flushes them through one backend call.
+
+    A flush happens when ``max_batch`` items are pending or ``max_wait_ms``
+    has elapsed since the first pending item, whichever comes first. The
+    flush function receives the batched items in submission order and must
+    return one result per item, in the same order.
+    """
+
+    def __init__(
+        self, flush_fn: FlushFn, max_batch: int = 16, max_wait_ms: float = 10.0
+    ) -> None:
+        self._flush_fn = flush_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Enqueue ``item`` and await its result from the batched call.
+
+        Flushes always run on their own task, never inline in the
+        submitter that happened to trip ``max_batch``: that caller being
+        cancelled (timeouts, gather siblings) must not abandon the
+        flush and strand every other future in the batch.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        batch: Optional[List[Tuple[Any, asyncio.Future]]] = None
+        async with self._lock:
+            self._pending.append((item, future))
+            if len(self._pending) >= self.max_batch:
+                batch = self._take_locked()
+            elif self._timer is None:
+                self._timer = asyncio.create_task(self._flush_after_wait())
+        if batch is not None:
+            task = asyncio.create_task(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def _flush_after_wait(self) -> None:
+        await asyncio.sleep(self.max_wait)
+        async with self._lock:
+            batch = self._take_locked()
+        await self._flush(batch)
+
+    def _take_locked(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Detach the pending batch and cancel the flush timer. Lock held."""
+        batch, self._pending = self._pending, []
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        return batch
+
+    async def _flush(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        if not batch:
+            return
+        items = [item for item, _ in batch]
+        try:
+            results = await self._flush_fn(items)
+        except BaseException as exc:  # propagate the batch failure to every
+            # caller - including CancelledError (loop shutdown), which must
+            # not leave the batch's futures pending forever.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,102 @@
+"""Process-local response cache shared by the LLM integrations.
+
+LLM calls are I/O dominated: a cache hit is O(microseconds) against
+O(100ms-seconds) for a full API round-trip, and every hit also saves the
+tokens the provider would have billed. The cache is keyed on a SHA-256 of
+everything that influences the completion (model, system prompt, user
+prompt, temperature, max_tokens) so a hit is always a safe substitute for
+the call it replaces. Eviction is LRU bounded by total payload bytes, and
+entries expire after a TTL so long-running agent processes do not serve
+stale completions forever.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """Content-addressed key for one LLM completion request."""
+
+    digest: str
+
+    @classmethod
+    def from_prompt(
+        cls,
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> "CacheKey":
+        payload = "\x1f".join(
+            (model, system_prompt or "", prompt, repr(temperature), str(max_tokens))
+        )
+        return cls(hashlib.sha256(payload.encode("utf-8")).hexdigest())
+
+
+class _Entry:
+    __slots__ = ("value", "size", "stored_at")
+
+    def __init__(self, value: Any, size: int, stored_at: float) -> None:
+        self.value = value
+        self.size = size
+        self.stored_at = stored_at
+
+
+class SmartLLMCache:
+    """LRU + TTL cache for LLM responses, safe for concurrent async use."""
+
+    def __init__(self, max_bytes: int = 100 * 1024 * 1024, ttl: float = 3600.0) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, key: CacheKey) -> Optional[Any]:
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if time.monotonic() - entry.stored_at > self.ttl:
+                del self._entries[key]
+                self._current_bytes -= entry.size
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    async def put(self, key: CacheKey, value: Any, size: int) -> None:
+        async with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._current_bytes -= old.size
+            self._entries[key] = _Entry(value, size, time.monotonic())
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= evicted.size
+
+    def stats(self) -> dict:
+        total = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._current_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+        }
+
+
+# One cache per process: GPT and Claude integrations share it, and keys
+# embed the model name so responses never cross providers.
+shared_llm_cache = SmartLLMCache()
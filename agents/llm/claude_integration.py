@@ -0,0 +1,418 @@
+"""Claude 4.1 integration for architecture, analysis and review agents.
+
+Responses are currently simulated (replace the mock responder with the real
+Anthropic API call once credentials are wired through the environment), but
+the surrounding plumbing - rate limiting, usage accounting, response
+validation and the shared response cache - is the production path.
+"""
+
+import functools
+import logging
+import string
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import asyncio
+import warnings
+import weakref
+
+import orjson
+
+from .batcher import AsyncBatcher
+from .cache import CacheKey, shared_llm_cache
+from .rate_limit import TokenBucket
+from .tokenizers import count_tokens
+
+
+@functools.lru_cache(maxsize=64)
+def _claude_logger(model: str) -> logging.Logger:
+    return logging.getLogger(f"llm.claude.{model}")
+
+
+def _warn_unclosed(client: Any, label: str) -> None:
+    """GC-time finalizer: warn only if the client was never closed."""
+    if not getattr(client, "is_closed", True):
+        warnings.warn(
+            f"Unclosed {label}; call aclose() on shutdown", ResourceWarning
+        )
+
+
+# System prompts for the analysis helpers are stable across calls, so they
+# are built once (constants, or memoized per analysis_type below). Stable
+# prompts also let provider-side prompt caching hit: when the real Anthropic
+# client lands, these are the system blocks to mark with
+# cache_control={"type": "ephemeral"}.
+_ARCH_SYS = (
+    "You are a system architect. Design a complete architecture: "
+    "components, interfaces, data models and deployment topology. "
+    "Document every major decision with its rationale."
+)
+_REVIEW_SYS = (
+    "You are a code reviewer. Check the implementation against the "
+    "requirements: correctness, completeness, tests, security and "
+    "maintainability. Be specific and actionable."
+)
+
+
+# Prompt templates are parsed once at import; per-call work is a single
+# substitute() instead of re-concatenating f-string pieces.
+_ANALYZE_TPL = string.Template(
+    "Codebase summary:\n$summary\n\nProvide your analysis:\n"
+)
+_ARCH_TPL = string.Template(
+    "Requirements:\n$requirements\n$constraints\n"
+    "Produce the architecture design:\n"
+)
+_REVIEW_TPL = string.Template(
+    "Requirements:\n$requirements\n\nImplementation:\n$code\n\n"
+    "Provide your review:\n"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _analysis_system_prompt(analysis_type: str) -> str:
+    return (
+        f"You are a senior engineer performing a {analysis_type} analysis "
+        f"of a codebase. Identify issues, risks and concrete improvements."
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class ClaudeConfig:
+    """Configuration for a Claude 4.1 integration instance."""
+
+    model: str = "claude-opus-4-1"
+    max_tokens: int = 8192
+    temperature: float = 0.1
+    rate_limit_per_minute: int = 50
+    api_key: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ClaudeResponse:
+    """A single completion returned by the Claude backend."""
+
+    content: str
+    model: str
+    usage_tokens: int
+    stop_reason: str = "end_turn"
+
+
+class ClaudeIntegration:
+    """Thin async client for Claude 4.1 used by the analysis-oriented agents."""
+
+    def __init__(self, config: Optional[ClaudeConfig] = None) -> None:
+        self.config = config or ClaudeConfig()
+        self.logger = _claude_logger(self.config.model)
+        self._request_count = 0
+        self._total_tokens = 0
+        self._cache = shared_llm_cache
+        self._bucket = TokenBucket(
+            self.config.rate_limit_per_minute,
+            burst=self.config.rate_limit_per_minute,
+        )
+        # One batcher per system prompt: prompts sharing a system prompt can
+        # travel in the same backend request, maximizing batch packing.
+        self._batchers: Dict[Optional[str], AsyncBatcher] = {}
+        self._client: Optional[Any] = None  # httpx.AsyncClient, created lazily
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def _get_client(self) -> Any:
+        """Shared HTTP client for all API calls from this instance.
+
+        Created once and reused: connection pooling plus HTTP/2 multiplexing
+        let concurrent requests share warm TLS connections instead of paying
+        a handshake per call - the dominant latency for small prompts.
+        httpx is imported lazily so the keyless mock path needs no SDK.
+        Call aclose() on shutdown; an unclosed client warns at GC time.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=50
+                ),
+                timeout=30.0,
+            )
+            # Detached again in aclose(); the warning only fires for a
+            # client that reaches GC still open.
+            self._finalizer = weakref.finalize(
+                self,
+                _warn_unclosed,
+                self._client,
+                f"ClaudeIntegration client for {self.config.model}",
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def generate_response(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> ClaudeResponse:
+        """Generate a completion, serving repeats from the shared cache.
+
+        The cache check runs before the rate-limit check so hits consume no
+        rate budget and pay no backend latency.
+        """
+        key = CacheKey.from_prompt(
+            self.config.model,
+            system_prompt,
+            prompt,
+            self.config.temperature,
+            self.config.max_tokens,
+        )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        prompt_tokens = count_tokens(self.config.model, prompt)
+        if system_prompt:
+            prompt_tokens += count_tokens(self.config.model, system_prompt)
+        if prompt_tokens > self.config.max_tokens:
+            self.logger.warning(
+                "Prompt is %d tokens, above the %d-token budget",
+                prompt_tokens,
+                self.config.max_tokens,
+            )
+        response = await self._get_batcher(system_prompt).submit(prompt)
+        await self._cache.put(key, response, size=len(response.content.encode("utf-8")))
+        self.logger.info("Generated response (%d tokens)", response.usage_tokens)
+        return response
+
+    async def generate_response_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Yield response text incrementally as the backend produces it.
+
+        Streaming overlaps downstream agent work (validation, dispatch) with
+        the model's decode time instead of blocking for the full response.
+        Callers that only need a validated prefix (e.g. a JSON envelope) can
+        break out of the async-for early, saving wall time and tokens - in
+        that case nothing is cached. Cache hits replay the stored content as
+        a single chunk.
+        """
+        key = CacheKey.from_prompt(
+            self.config.model,
+            system_prompt,
+            prompt,
+            self.config.temperature,
+            self.config.max_tokens,
+        )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            yield cached.content
+            return
+
+        await self._check_rate_limit()
+        parts: List[str] = []
+        async for chunk in self._mock_claude_stream(prompt, system_prompt):
+            parts.append(chunk)
+            yield chunk
+        content = "".join(parts)
+        response = ClaudeResponse(
+            content=content,
+            model=self.config.model,
+            usage_tokens=max(1, (len(prompt) + len(content)) // 4),
+        )
+        self._request_count += 1
+        self._total_tokens += response.usage_tokens
+        await self._cache.put(key, response, size=len(content.encode("utf-8")))
+
+    async def _mock_claude_stream(
+        self, prompt: str, system_prompt: Optional[str]
+    ) -> AsyncIterator[str]:
+        """Simulated streaming responder - replace with Anthropic messages.stream."""
+        content = f"[{self.config.model} mock] Response to: {prompt[:120]}"
+        for start in range(0, len(content), 16):
+            await asyncio.sleep(0.005)  # Simulate per-chunk decode latency
+            yield content[start : start + 16]
+
+    def _get_batcher(self, system_prompt: Optional[str]) -> AsyncBatcher:
+        batcher = self._batchers.get(system_prompt)
+        if batcher is None:
+            batcher = AsyncBatcher(
+                lambda prompts, sp=system_prompt: self._flush_batch(prompts, sp)
+            )
+            self._batchers[system_prompt] = batcher
+        return batcher
+
+    async def _flush_batch(
+        self, prompts: List[str], system_prompt: Optional[str]
+    ) -> List[ClaudeResponse]:
+        """Send one batched backend request; one rate-limit check per batch."""
+        await self._check_rate_limit()
+        if self.config.api_key:
+            responses = await self._claude_response(prompts, system_prompt)
+        else:
+            responses = await self._mock_claude_response(prompts, system_prompt)
+        self._request_count += 1
+        for response in responses:
+            self._total_tokens += response.usage_tokens
+        invalid = self.validate_responses(responses).count(False)
+        if invalid:
+            self.logger.warning(
+                "%d of %d batched responses failed validation",
+                invalid,
+                len(responses),
+            )
+        return responses
+
+    async def _check_rate_limit(self) -> None:
+        """Take one request token, waiting for bucket refill if exhausted.
+
+        The bucket is local to the process, so the request path pays no
+        network round-trip; deployments sharing budget across processes
+        reconcile the bucket with the Convex Rate Limiter component
+        periodically via TokenBucket.set_tokens.
+        """
+        await self._bucket.acquire()
+
+    async def _claude_response(
+        self, prompts: List[str], system_prompt: Optional[str]
+    ) -> List[ClaudeResponse]:
+        """Call the Anthropic Messages API for a batch of prompts.
+
+        The Messages API takes one prompt per request, so the batch fans out
+        as concurrent requests multiplexed over the shared HTTP/2 connection
+        - one TCP stream, no per-prompt handshake.
+        """
+        client = self._get_client()
+        headers = {
+            "x-api-key": self.config.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        }
+
+        async def one(prompt: str) -> ClaudeResponse:
+            body: Dict[str, Any] = {
+                "model": self.config.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": self.config.max_tokens,
+                "temperature": self.config.temperature,
+            }
+            if system_prompt:
+                # Mark the (static) system block for Anthropic prompt
+                # caching: repeat calls bill the cached prefix at the
+                # reduced rate and skip its prefill latency.
+                body["system"] = [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            # orjson encodes/decodes the wire bodies several times faster
+            # than stdlib json - after connection reuse, (de)serialization
+            # is the next-largest CPU cost per request.
+            resp = await client.post(
+                "https://api.anthropic.com/v1/messages",
+                content=orjson.dumps(body),
+                headers=headers,
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            usage = data.get("usage", {})
+            return ClaudeResponse(
+                content=data["content"][0]["text"],
+                model=data.get("model", self.config.model),
+                usage_tokens=usage.get("input_tokens", 0)
+                + usage.get("output_tokens", 0),
+                stop_reason=data.get("stop_reason", "end_turn"),
+            )
+
+        return list(await asyncio.gather(*[one(p) for p in prompts]))
+
+    async def _mock_claude_response(
+        self, prompts: List[str], system_prompt: Optional[str]
+    ) -> List[ClaudeResponse]:
+        """Simulated Claude responder - replace with the real Anthropic call.
+
+        Takes a batch of prompts and answers them in one simulated request.
+        The real Messages API has no list-prompt form, so the production
+        implementation fans out with bounded concurrency instead.
+        """
+        await asyncio.sleep(0.05)  # Simulate API latency for the whole batch
+        responses = []
+        for prompt in prompts:
+            content = f"[{self.config.model} mock] Response to: {prompt[:120]}"
+            responses.append(
+                ClaudeResponse(
+                    content=content,
+                    model=self.config.model,
+                    usage_tokens=max(1, (len(prompt) + len(content)) // 4),
+                )
+            )
+        return responses
+
+    def validate_response(self, response: Optional[ClaudeResponse]) -> bool:
+        """Basic sanity checks applied to every completion before use."""
+        if response is None:
+            return False
+        if not response.content or not response.content.strip():
+            return False
+        return response.usage_tokens <= self.config.max_tokens
+
+    def validate_responses(
+        self, responses: List[Optional[ClaudeResponse]]
+    ) -> List[bool]:
+        """Validate a whole batch of completions with one Python dispatch.
+
+        Called once per micro-batch instead of once per response. A tight
+        comprehension over local bindings, not numpy: batches are capped at
+        the micro-batcher size (16), where vectorization overhead would
+        outweigh the loop it replaces.
+        """
+        max_tokens = self.config.max_tokens
+        return [
+            response is not None
+            and bool(response.content)
+            and not response.content.isspace()
+            and response.usage_tokens <= max_tokens
+            for response in responses
+        ]
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.config.model,
+            "request_count": self._request_count,
+            "total_tokens": self._total_tokens,
+            "cache": self._cache.stats(),
+        }
+
+    async def analyze_codebase(
+        self, code_summary: str, analysis_type: str = "general"
+    ) -> ClaudeResponse:
+        """Analyze a codebase summary (architecture, quality, security, ...)."""
+        prompt = _ANALYZE_TPL.substitute(summary=code_summary)
+        return await self.generate_response(
+            prompt, system_prompt=_analysis_system_prompt(analysis_type)
+        )
+
+    async def design_architecture(
+        self, requirements: str, constraints: str = ""
+    ) -> ClaudeResponse:
+        """Design a system architecture from requirements and constraints."""
+        prompt = _ARCH_TPL.substitute(
+            requirements=requirements,
+            constraints=f"\nConstraints:\n{constraints}\n" if constraints else "",
+        )
+        return await self.generate_response(prompt, system_prompt=_ARCH_SYS)
+
+    async def review_implementation(
+        self, code: str, requirements: str
+    ) -> ClaudeResponse:
+        """Review an implementation against its requirements."""
+        prompt = _REVIEW_TPL.substitute(requirements=requirements, code=code)
+        return await self.generate_response(prompt, system_prompt=_REVIEW_SYS)
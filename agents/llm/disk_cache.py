@@ -0,0 +1,107 @@
+"""Disk spill for the LLM response cache, surviving process restarts.
+
+Agent reruns over the same project repeat most of their prompts; an
+in-memory cache loses all of that on restart. Entries are one orjson
+file per cache key. Reads run off the event loop in the default thread
+pool; writes are fire-and-forget through a background drainer that
+batches everything queued into one thread-pool hop, amortizing the
+scheduling cost the way batched submission amortizes syscalls. Files
+land via write-to-temp + os.replace so a crash never leaves a torn
+entry.
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger("llm.disk_cache")
+
+# Max entries drained into one batched write.
+_WRITE_BATCH = 32
+
+
+class DiskCache:
+    """Async key -> JSON-payload store under one directory."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._queue: "asyncio.Queue[Tuple[str, bytes]]" = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Read one entry; None when absent or unreadable."""
+        path = self._path(key)
+
+        def read() -> Optional[bytes]:
+            try:
+                return path.read_bytes()
+            except OSError:
+                return None
+
+        data = await asyncio.to_thread(read)
+        if data is None:
+            return None
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.warning("Dropping corrupt cache entry %s", path.name)
+            return None
+
+    async def put(self, key: str, payload: dict) -> None:
+        """Queue one entry for the background writer; returns immediately."""
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(
+                self._write_loop(), name="disk-cache-writer"
+            )
+        await self._queue.put((key, orjson.dumps(payload)))
+
+    async def flush(self) -> None:
+        """Wait until every queued write has hit disk."""
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Flush pending writes, then stop the background writer.
+
+        Without this a graceful shutdown drops whatever the writer has
+        not drained yet - defeating the restart-replay purpose of the
+        tier - and leaves the writer task pending at loop teardown.
+        """
+        if self._writer is None:
+            return
+        if not self._writer.done():
+            await self._queue.join()
+            self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+
+    async def _write_loop(self) -> None:
+        """Drain queued writes, batching bursts into one thread-pool hop."""
+        while True:
+            batch: List[Tuple[str, bytes]] = [await self._queue.get()]
+            while len(batch) < _WRITE_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except OSError as exc:
+                logger.error("Disk cache write failed: %s", exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[str, bytes]]) -> None:
+        for key, data in batch:
+            path = self._path(key)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
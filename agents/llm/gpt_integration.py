@@ -0,0 +1,393 @@
+"""GPT-5 integration for code generation and requirements analysis.
+
+Responses are currently simulated (replace the mock responder with the real
+OpenAI API call once credentials are wired through the environment), but the
+surrounding plumbing - rate limiting, usage accounting, response validation
+and the shared response cache - is the production path.
+"""
+
+import functools
+import logging
+import string
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import asyncio
+import warnings
+import weakref
+
+import orjson
+
+from .batcher import AsyncBatcher
+from .cache import CacheKey, shared_llm_cache
+from .rate_limit import TokenBucket
+from .tokenizers import count_tokens
+
+
+@functools.lru_cache(maxsize=64)
+def _gpt_logger(model: str) -> logging.Logger:
+    return logging.getLogger(f"llm.gpt.{model}")
+
+
+# Prompt templates are parsed once at import; per-call work is a single
+# substitute() instead of re-concatenating f-string pieces, and the stable
+# text also makes prompt hashing for cache keys cheaper.
+def _warn_unclosed(client: Any, label: str) -> None:
+    """GC-time finalizer: warn only if the client was never closed."""
+    if not getattr(client, "is_closed", True):
+        warnings.warn(
+            f"Unclosed {label}; call aclose() on shutdown", ResourceWarning
+        )
+
+
+_CODE_GEN_TPL = string.Template(
+    "Tech stack: $stack\nTask: $task\n$ctx\nGenerate the requested code:\n"
+)
+_REQ_ANALYSIS_TPL = string.Template(
+    "Requirements:\n$requirements\n\nProduce the task breakdown:\n"
+)
+_REQ_ANALYSIS_SYS = (
+    "You are a requirements analyst. Break the requirements into "
+    "concrete, testable engineering tasks with dependencies."
+)
+
+
+# Static so the provider's prompt-prefix cache hits on every call: any
+# dynamic data (tech stack, context) belongs in the user message, not here.
+_CODE_GEN_SYS = (
+    "You are a code generation agent. Produce complete, tested, "
+    "production-quality code for the tech stack named in the task."
+)
+
+
+@dataclass(slots=True, frozen=True)
+class GPTConfig:
+    """Configuration for a GPT-5 integration instance."""
+
+    model: str = "gpt-5"
+    max_tokens: int = 4096
+    temperature: float = 0.2
+    rate_limit_per_minute: int = 60
+    api_key: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LLMResponse:
+    """A single completion returned by the GPT backend."""
+
+    content: str
+    model: str
+    usage_tokens: int
+    finish_reason: str = "stop"
+
+
+class GPTIntegration:
+    """Thin async client for GPT-5 used by the coding-oriented agents."""
+
+    def __init__(self, config: Optional[GPTConfig] = None) -> None:
+        self.config = config or GPTConfig()
+        self.logger = _gpt_logger(self.config.model)
+        self._request_count = 0
+        self._total_tokens = 0
+        self._cache = shared_llm_cache
+        self._bucket = TokenBucket(
+            self.config.rate_limit_per_minute,
+            burst=self.config.rate_limit_per_minute,
+        )
+        # One batcher per system prompt: prompts sharing a system prompt can
+        # travel in the same backend request, maximizing batch packing.
+        self._batchers: Dict[Optional[str], AsyncBatcher] = {}
+        self._client: Optional[Any] = None  # httpx.AsyncClient, created lazily
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def _get_client(self) -> Any:
+        """Shared HTTP client for all API calls from this instance.
+
+        Created once and reused: connection pooling plus HTTP/2 multiplexing
+        let concurrent requests share warm TLS connections instead of paying
+        a handshake per call - the dominant latency for small prompts.
+        httpx is imported lazily so the keyless mock path needs no SDK.
+        Call aclose() on shutdown; an unclosed client warns at GC time.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=50
+                ),
+                timeout=30.0,
+            )
+            # Detached again in aclose(); the warning only fires for a
+            # client that reaches GC still open.
+            self._finalizer = weakref.finalize(
+                self,
+                _warn_unclosed,
+                self._client,
+                f"GPTIntegration client for {self.config.model}",
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def generate_response(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> LLMResponse:
+        """Generate a completion, serving repeats from the shared cache.
+
+        The cache check runs before the rate-limit check so hits consume no
+        rate budget and pay no backend latency.
+        """
+        key = CacheKey.from_prompt(
+            self.config.model,
+            system_prompt,
+            prompt,
+            self.config.temperature,
+            self.config.max_tokens,
+        )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        prompt_tokens = count_tokens(self.config.model, prompt)
+        if system_prompt:
+            prompt_tokens += count_tokens(self.config.model, system_prompt)
+        if prompt_tokens > self.config.max_tokens:
+            self.logger.warning(
+                "Prompt is %d tokens, above the %d-token budget",
+                prompt_tokens,
+                self.config.max_tokens,
+            )
+        response = await self._get_batcher(system_prompt).submit(prompt)
+        await self._cache.put(key, response, size=len(response.content.encode("utf-8")))
+        self.logger.info("Generated response (%d tokens)", response.usage_tokens)
+        return response
+
+    async def generate_response_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Yield response text incrementally as the backend produces it.
+
+        Streaming overlaps downstream agent work (validation, dispatch) with
+        the model's decode time instead of blocking for the full response.
+        Callers that only need a validated prefix (e.g. a JSON envelope) can
+        break out of the async-for early, saving wall time and tokens - in
+        that case nothing is cached. Cache hits replay the stored content as
+        a single chunk.
+        """
+        key = CacheKey.from_prompt(
+            self.config.model,
+            system_prompt,
+            prompt,
+            self.config.temperature,
+            self.config.max_tokens,
+        )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            yield cached.content
+            return
+
+        await self._check_rate_limit()
+        parts: List[str] = []
+        async for chunk in self._mock_gpt_stream(prompt, system_prompt):
+            parts.append(chunk)
+            yield chunk
+        content = "".join(parts)
+        response = LLMResponse(
+            content=content,
+            model=self.config.model,
+            usage_tokens=max(1, (len(prompt) + len(content)) // 4),
+        )
+        self._request_count += 1
+        self._total_tokens += response.usage_tokens
+        await self._cache.put(key, response, size=len(content.encode("utf-8")))
+
+    async def _mock_gpt_stream(
+        self, prompt: str, system_prompt: Optional[str]
+    ) -> AsyncIterator[str]:
+        """Simulated streaming responder - replace with OpenAI stream=True."""
+        content = f"[{self.config.model} mock] Response to: {prompt[:120]}"
+        for start in range(0, len(content), 16):
+            await asyncio.sleep(0.005)  # Simulate per-chunk decode latency
+            yield content[start : start + 16]
+
+    def _get_batcher(self, system_prompt: Optional[str]) -> AsyncBatcher:
+        batcher = self._batchers.get(system_prompt)
+        if batcher is None:
+            batcher = AsyncBatcher(
+                lambda prompts, sp=system_prompt: self._flush_batch(prompts, sp)
+            )
+            self._batchers[system_prompt] = batcher
+        return batcher
+
+    async def _flush_batch(
+        self, prompts: List[str], system_prompt: Optional[str]
+    ) -> List[LLMResponse]:
+        """Send one batched backend request; one rate-limit check per batch."""
+        await self._check_rate_limit()
+        if self.config.api_key:
+            responses = await self._gpt_response(prompts, system_prompt)
+        else:
+            responses = await self._mock_gpt_response(prompts, system_prompt)
+        self._request_count += 1
+        for response in responses:
+            self._total_tokens += response.usage_tokens
+        invalid = self.validate_responses(responses).count(False)
+        if invalid:
+            self.logger.warning(
+                "%d of %d batched responses failed validation",
+                invalid,
+                len(responses),
+            )
+        return responses
+
+    async def _check_rate_limit(self) -> None:
+        """Take one request token, waiting for bucket refill if exhausted.
+
+        The bucket is local to the process, so the request path pays no
+        network round-trip; deployments sharing budget across processes
+        reconcile the bucket with the Convex Rate Limiter component
+        periodically via TokenBucket.set_tokens.
+        """
+        await self._bucket.acquire()
+
+    async def _gpt_response(
+        self, prompts: List[str], system_prompt: Optional[str]
+    ) -> List[LLMResponse]:
+        """Call the OpenAI API for a batch of prompts.
+
+        The chat completions endpoint takes one prompt per request, so the
+        batch fans out as concurrent requests multiplexed over the shared
+        HTTP/2 connection - one TCP stream, no per-prompt handshake.
+        """
+        client = self._get_client()
+        headers = {
+            "Authorization": f"Bearer {self.config.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        async def one(prompt: str) -> LLMResponse:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+            # orjson encodes/decodes the wire bodies several times faster
+            # than stdlib json - after connection reuse, (de)serialization
+            # is the next-largest CPU cost per request.
+            resp = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                content=orjson.dumps(
+                    {
+                        "model": self.config.model,
+                        "messages": messages,
+                        "max_tokens": self.config.max_tokens,
+                        "temperature": self.config.temperature,
+                    }
+                ),
+                headers=headers,
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            choice = data["choices"][0]
+            return LLMResponse(
+                content=choice["message"]["content"],
+                model=data.get("model", self.config.model),
+                usage_tokens=data.get("usage", {}).get("total_tokens", 0),
+                finish_reason=choice.get("finish_reason", "stop"),
+            )
+
+        return list(await asyncio.gather(*[one(p) for p in prompts]))
+
+    async def _mock_gpt_response(
+        self, prompts: List[str], system_prompt: Optional[str]
+    ) -> List[LLMResponse]:
+        """Simulated GPT-5 responder - replace with the real OpenAI call.
+
+        Takes a batch of prompts and answers them in one simulated request,
+        matching the list-prompt form of the completions API.
+        """
+        await asyncio.sleep(0.05)  # Simulate API latency for the whole batch
+        responses = []
+        for prompt in prompts:
+            content = f"[{self.config.model} mock] Response to: {prompt[:120]}"
+            responses.append(
+                LLMResponse(
+                    content=content,
+                    model=self.config.model,
+                    usage_tokens=max(1, (len(prompt) + len(content)) // 4),
+                )
+            )
+        return responses
+
+    def validate_response(self, response: Optional[LLMResponse]) -> bool:
+        """Basic sanity checks applied to every completion before use."""
+        if response is None:
+            return False
+        if not response.content or not response.content.strip():
+            return False
+        return response.usage_tokens <= self.config.max_tokens
+
+    def validate_responses(
+        self, responses: List[Optional[LLMResponse]]
+    ) -> List[bool]:
+        """Validate a whole batch of completions with one Python dispatch.
+
+        Called once per micro-batch instead of once per response. A tight
+        comprehension over local bindings, not numpy: batches are capped at
+        the micro-batcher size (16), where vectorization overhead would
+        outweigh the loop it replaces.
+        """
+        max_tokens = self.config.max_tokens
+        return [
+            response is not None
+            and bool(response.content)
+            and not response.content.isspace()
+            and response.usage_tokens <= max_tokens
+            for response in responses
+        ]
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.config.model,
+            "request_count": self._request_count,
+            "total_tokens": self._total_tokens,
+            "cache": self._cache.stats(),
+        }
+
+    async def generate_code(
+        self,
+        task_description: str,
+        tech_stack: List[str],
+        existing_context: str = "",
+    ) -> LLMResponse:
+        """Generate code for a development task."""
+        prompt = _CODE_GEN_TPL.substitute(
+            stack=", ".join(tech_stack),
+            task=task_description,
+            ctx=(
+                f"\nExisting context: {existing_context}\n"
+                if existing_context
+                else ""
+            ),
+        )
+        return await self.generate_response(
+            prompt, system_prompt=_CODE_GEN_SYS
+        )
+
+    async def analyze_requirements(self, requirements: str) -> LLMResponse:
+        """Break product requirements down into actionable engineering tasks."""
+        prompt = _REQ_ANALYSIS_TPL.substitute(requirements=requirements)
+        return await self.generate_response(
+            prompt, system_prompt=_REQ_ANALYSIS_SYS
+        )
@@ -0,0 +1,499 @@
+"""Routes LLM work to the right provider with fallback.
+
+The manager sits between the agents and the provider integrations: it
+picks GPT-5 or Claude based on task type, falls back to the other
+provider when the preferred one fails, and serves deterministic repeats
+from an in-process exact-match cache so identical templated prompts pay
+a dict lookup instead of an HTTP round-trip.
+
+The provider integration modules import lazily on first use, so a
+process that only ever routes to one provider never pays the import
+cost (SDKs, HTTP stack) of the other.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+import orjson
+
+from .disk_cache import DiskCache
+from .rate_limit import TokenBucket
+from .semantic_cache import SemanticCache
+from .tokenizers import count_tokens
+
+if TYPE_CHECKING:
+    from .claude_integration import ClaudeConfig, ClaudeIntegration, ClaudeResponse
+    from .gpt_integration import GPTConfig, GPTIntegration, LLMResponse
+
+    ManagedResponse = Union[LLMResponse, ClaudeResponse]
+
+
+@functools.lru_cache(maxsize=1)
+def _provider_errors() -> tuple:
+    """Failures worth falling back over: transport problems, timeouts and
+    HTTP error statuses. Anything else (programming errors, cancellation)
+    should surface, not be silently retried on the other provider.
+    Resolved lazily so httpx loads only once a provider is in use.
+    """
+    errors: tuple = (asyncio.TimeoutError, ConnectionError, OSError)
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - optional at import time
+        return errors
+    return errors + (httpx.HTTPStatusError, httpx.TransportError)
+
+
+class LLMProvider(StrEnum):
+    GPT = "gpt"
+    CLAUDE = "claude"
+
+
+class TaskType(StrEnum):
+    CODE_GENERATION = "code_generation"
+    REQUIREMENTS_ANALYSIS = "requirements_analysis"
+    CODEBASE_ANALYSIS = "codebase_analysis"
+    ARCHITECTURE = "architecture"
+    REVIEW = "review"
+    GENERAL = "general"
+
+
+# Static system prompts, byte-identical on every call: provider-side
+# prompt caching (Anthropic cache_control, OpenAI automatic prefix cache)
+# only hits on a stable prefix, so all variable data (tech stack, analysis
+# type, context) travels in the user message instead.
+CODE_GEN_SYSTEM_PROMPT = (
+    "You are a code generation agent. Produce complete, tested, "
+    "production-quality code for the tech stack named in the task."
+)
+CODE_ANALYSIS_SYSTEM_PROMPT = (
+    "You are a code analysis agent. Analyze the provided code for the "
+    "requested aspect and report concrete, actionable findings."
+)
+
+# Which provider each task type prefers; the other is the fallback.
+_PREFERRED_PROVIDER = {
+    TaskType.CODE_GENERATION: LLMProvider.GPT,
+    TaskType.REQUIREMENTS_ANALYSIS: LLMProvider.GPT,
+    TaskType.CODEBASE_ANALYSIS: LLMProvider.CLAUDE,
+    TaskType.ARCHITECTURE: LLMProvider.CLAUDE,
+    TaskType.REVIEW: LLMProvider.CLAUDE,
+    TaskType.GENERAL: LLMProvider.GPT,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class LLMManagerConfig:
+    """Routing and caching knobs for an LLMManager instance."""
+
+    enable_fallback: bool = True
+    enable_cache: bool = True
+    max_cache_entries: int = 1024
+    enable_semantic_cache: bool = True
+    semantic_threshold: float = 0.92
+    max_concurrent_per_provider: int = 8
+    tokens_per_minute: int = 90_000
+    # Directory for the persistent response cache; None keeps it off.
+    disk_cache_dir: Optional[str] = None
+
+
+class LLMManager:
+    """Single entry point for agent LLM calls across both providers."""
+
+    def __init__(
+        self,
+        config: Optional[LLMManagerConfig] = None,
+        gpt_config: Optional[GPTConfig] = None,
+        claude_config: Optional[ClaudeConfig] = None,
+    ) -> None:
+        self.config = config or LLMManagerConfig()
+        # Integrations are created (and their modules imported) on first
+        # access through the gpt/claude properties.
+        self._gpt_config = gpt_config
+        self._claude_config = claude_config
+        self._gpt: Optional[GPTIntegration] = None
+        self._claude: Optional[ClaudeIntegration] = None
+        self.logger = logging.getLogger("llm.manager")
+        # Exact-match response cache. The provider integrations keep their
+        # own caches keyed on model parameters; this one sits above routing
+        # so a hit skips provider selection and fallback entirely.
+        self._cache: "OrderedDict[str, ManagedResponse]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Second cache tier: catches paraphrases the hash misses. No-op
+        # when sentence-transformers is not installed.
+        self._semantic_cache = SemanticCache(
+            threshold=self.config.semantic_threshold
+        )
+        # Single-flight: concurrent callers with the same cache key share
+        # one provider call instead of issuing N identical billed requests.
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Optional persistence: reruns after a restart replay yesterday's
+        # responses from disk instead of re-billing them.
+        self._disk_cache = (
+            DiskCache(self.config.disk_cache_dir)
+            if self.config.disk_cache_dir
+            else None
+        )
+        # Preemptive throttling so bursts never reach the provider's 429
+        # path (which would trigger fallback and double the spend): a
+        # bounded semaphore caps in-flight requests per provider, and a
+        # token bucket paces estimated prompt tokens against the TPM
+        # budget. The integrations' own buckets handle the RPM dimension.
+        self._sems = {
+            provider: asyncio.Semaphore(self.config.max_concurrent_per_provider)
+            for provider in LLMProvider
+        }
+        self._tpm = {
+            provider: TokenBucket(
+                self.config.tokens_per_minute,
+                burst=self.config.tokens_per_minute,
+            )
+            for provider in LLMProvider
+        }
+
+    @property
+    def gpt(self) -> GPTIntegration:
+        if self._gpt is None:
+            from .gpt_integration import GPTIntegration
+
+            self._gpt = GPTIntegration(self._gpt_config)
+        return self._gpt
+
+    @property
+    def claude(self) -> ClaudeIntegration:
+        if self._claude is None:
+            from .claude_integration import ClaudeIntegration
+
+            self._claude = ClaudeIntegration(self._claude_config)
+        return self._claude
+
+    def _provider_client(self, provider: LLMProvider) -> Any:
+        """Dispatch to one integration; both share the same call surface."""
+        if provider is LLMProvider.GPT:
+            return self.gpt
+        if provider is LLMProvider.CLAUDE:
+            return self.claude
+        return None
+
+    @staticmethod
+    def _cache_key(
+        provider: LLMProvider,
+        prompt: str,
+        system_prompt: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> str:
+        # orjson serializes the key payload several times faster than
+        # stdlib json and returns bytes directly, skipping the encode step.
+        payload = orjson.dumps(
+            {
+                "p": provider,
+                "sys": system_prompt,
+                "prompt": prompt,
+                "ctx": context,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        # BLAKE2b at 16 bytes: collision-safe for a cache key and roughly
+        # twice as fast as SHA-256 on these short payloads.
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[ManagedResponse]:
+        response = self._cache.get(key)
+        if response is None:
+            self._cache_misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._cache_hits += 1
+        return response
+
+    def _cache_put(self, key: str, response: ManagedResponse) -> None:
+        self._cache[key] = response
+        while len(self._cache) > self.config.max_cache_entries:
+            self._cache.popitem(last=False)
+
+    def _select_provider(self, task_type: TaskType) -> LLMProvider:
+        return _PREFERRED_PROVIDER.get(task_type, LLMProvider.GPT)
+
+    async def generate_response(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        system_prompt: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: Optional[bool] = None,
+    ) -> ManagedResponse:
+        """Route ``prompt`` to the preferred provider for ``task_type``.
+
+        Deterministic repeats (templated agent prompts at low temperature)
+        are served from the exact-match cache before any provider is
+        touched. Nondeterministic callers pass ``use_cache=False``.
+        """
+        provider = self._select_provider(task_type)
+        cacheable = self.config.enable_cache if use_cache is None else use_cache
+        if not cacheable:
+            return await self._dispatch(
+                provider, task_type, prompt, system_prompt, context
+            )
+
+        key = self._cache_key(provider, prompt, system_prompt, context)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        if self.config.enable_semantic_cache:
+            near = self._semantic_cache.get(prompt, system_prompt)
+            if near is not None:
+                return near
+        if self._disk_cache is not None:
+            payload = await self._disk_cache.get(key)
+            if payload is not None:
+                response = self._response_from_payload(payload)
+                self._cache_put(key, response)
+                return response
+
+        # Single-flight: if an identical request is already in flight,
+        # piggyback on it rather than paying for a duplicate call.
+        leader = self._inflight.get(key)
+        if leader is not None:
+            return await leader
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._dispatch(
+                provider, task_type, prompt, system_prompt, context
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved; the leader re-raises below
+            raise
+        else:
+            future.set_result(response)
+            self._cache_put(key, response)
+            if self.config.enable_semantic_cache:
+                self._semantic_cache.put(prompt, response, system_prompt)
+            if self._disk_cache is not None:
+                await self._disk_cache.put(
+                    key, self._response_to_payload(response)
+                )
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _response_to_payload(response: ManagedResponse) -> Dict[str, Any]:
+        payload = {
+            "content": response.content,
+            "model": response.model,
+            "usage_tokens": response.usage_tokens,
+        }
+        if hasattr(response, "finish_reason"):
+            payload["provider"] = LLMProvider.GPT
+            payload["finish_reason"] = response.finish_reason
+        else:
+            payload["provider"] = LLMProvider.CLAUDE
+            payload["stop_reason"] = response.stop_reason
+        return payload
+
+    @staticmethod
+    def _response_from_payload(payload: Dict[str, Any]) -> ManagedResponse:
+        if payload["provider"] == LLMProvider.GPT:
+            from .gpt_integration import LLMResponse
+
+            return LLMResponse(
+                content=payload["content"],
+                model=payload["model"],
+                usage_tokens=payload["usage_tokens"],
+                finish_reason=payload.get("finish_reason", "stop"),
+            )
+        from .claude_integration import ClaudeResponse
+
+        return ClaudeResponse(
+            content=payload["content"],
+            model=payload["model"],
+            usage_tokens=payload["usage_tokens"],
+            stop_reason=payload.get("stop_reason", "end_turn"),
+        )
+
+    async def generate_responses_batch(
+        self,
+        prompts: list,
+        task_type: TaskType = TaskType.GENERAL,
+        system_prompt: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 16,
+    ) -> list:
+        """Answer many prompts in one provider round-trip where possible.
+
+        Prompts are submitted concurrently; the provider integrations'
+        micro-batchers (AsyncBatcher, keyed by system prompt) pack
+        submissions that land within the batch window into a single
+        backend request, so this turns N sequential calls into one
+        batched call plus fan-out. The semaphore bounds concurrency for
+        providers that must fan out per-prompt. Each prompt still goes
+        through the caches and single-flight, so repeats inside the
+        batch are free.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(prompt: str) -> ManagedResponse:
+            async with semaphore:
+                return await self.generate_response(
+                    prompt,
+                    task_type=task_type,
+                    system_prompt=system_prompt,
+                    context=context,
+                )
+
+        return list(await asyncio.gather(*[one(p) for p in prompts]))
+
+    async def _dispatch(
+        self,
+        provider: LLMProvider,
+        task_type: TaskType,
+        prompt: str,
+        system_prompt: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> ManagedResponse:
+        """Call the preferred provider, falling back to the other on failure."""
+        response = await self._try_provider(
+            provider, prompt, system_prompt, context
+        )
+        if response is None and self.config.enable_fallback:
+            fallback = (
+                LLMProvider.CLAUDE
+                if provider is LLMProvider.GPT
+                else LLMProvider.GPT
+            )
+            self.logger.warning(
+                "Provider %s failed, falling back to %s",
+                provider,
+                fallback,
+            )
+            response = await self._try_provider(
+                fallback, prompt, system_prompt, context
+            )
+        if response is None:
+            raise RuntimeError(
+                f"All providers failed for task type {task_type}"
+            )
+        return response
+
+    async def _try_provider(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        system_prompt: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> Optional[ManagedResponse]:
+        """Call one provider, returning None on a retriable failure so
+        routing can fall back. Non-transport errors propagate."""
+        client = self._provider_client(provider)
+        if client is None:
+            return None
+        estimated = count_tokens(client.config.model, prompt)
+        if system_prompt:
+            estimated += count_tokens(client.config.model, system_prompt)
+        try:
+            async with self._sems[provider]:
+                await self._tpm[provider].acquire(estimated)
+                return await client.generate_response(
+                    prompt, system_prompt=system_prompt, context=context
+                )
+        except _provider_errors() as exc:
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            if status == 429:
+                # We out-ran the provider's limit despite local pacing:
+                # drain the bucket so subsequent calls wait a full refill.
+                await self._tpm[provider].set_tokens(0)
+                self.logger.warning(
+                    "Provider %s rate-limited; backing off", provider
+                )
+            else:
+                self.logger.error(
+                    "Provider %s failed: %s", provider, exc
+                )
+        return None
+
+    async def generate_code(
+        self,
+        task_description: str,
+        tech_stack: Optional[list] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> ManagedResponse:
+        """Generate code for ``task_description`` via the code provider.
+
+        The system prompt is a static constant; the tech stack rides in
+        the user message so the provider's prefix cache hits every call.
+        """
+        stack = ", ".join(tech_stack) if tech_stack else "the project defaults"
+        prompt = f"Tech stack: {stack}\nTask: {task_description}"
+        return await self.generate_response(
+            prompt,
+            task_type=TaskType.CODE_GENERATION,
+            system_prompt=CODE_GEN_SYSTEM_PROMPT,
+            context=context,
+        )
+
+    async def analyze_code(
+        self,
+        code: str,
+        analysis_type: str = "general",
+        context: Optional[Dict[str, Any]] = None,
+    ) -> ManagedResponse:
+        """Analyze one code snippet via the analysis provider."""
+        prompt = f"Analysis type: {analysis_type}\n\nCode:\n{code}"
+        return await self.generate_response(
+            prompt,
+            task_type=TaskType.CODEBASE_ANALYSIS,
+            system_prompt=CODE_ANALYSIS_SYSTEM_PROMPT,
+            context=context,
+        )
+
+    async def analyze_code_batch(
+        self,
+        snippets: list,
+        analysis_type: str = "general",
+        context: Optional[Dict[str, Any]] = None,
+    ) -> list:
+        """Analyze many snippets as one batched provider call."""
+        prompts = [
+            f"Analysis type: {analysis_type}\n\nCode:\n{code}"
+            for code in snippets
+        ]
+        return await self.generate_responses_batch(
+            prompts,
+            task_type=TaskType.CODEBASE_ANALYSIS,
+            system_prompt=CODE_ANALYSIS_SYSTEM_PROMPT,
+            context=context,
+        )
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """Aggregate usage across providers plus manager cache counters."""
+        total = self._cache_hits + self._cache_misses
+        return {
+            # Only providers that have actually been used; touching the
+            # properties here would import and instantiate them.
+            "gpt": self._gpt.get_usage_stats() if self._gpt else None,
+            "claude": self._claude.get_usage_stats() if self._claude else None,
+            "cache_entries": len(self._cache),
+            "cache_hit_rate": self._cache_hits / total if total else 0.0,
+            "semantic_cache": self._semantic_cache.stats(),
+        }
+
+    async def aclose(self) -> None:
+        """Flush the disk cache and close any instantiated providers."""
+        if self._disk_cache is not None:
+            await self._disk_cache.aclose()
+        if self._gpt is not None:
+            await self._gpt.aclose()
+        if self._claude is not None:
+            await self._claude.aclose()
@@ -0,0 +1,62 @@
+"""In-process token-bucket rate limiting for LLM calls.
+
+Checking the Convex Rate Limiter component on every request would cost a
+network hop per call. Instead each integration runs a local token bucket
+sized to its provider budget and pays no network cost on the request path;
+a deployment that shares budget across processes reconciles the local
+bucket with the Convex component periodically (see ``set_tokens``), turning
+N remote checks into one per refill interval.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Continuous-refill token bucket, safe for concurrent async acquires.
+
+    Tokens accrue at ``rate_per_min / 60`` per second up to ``burst``.
+    ``acquire`` returns immediately while tokens remain and otherwise sleeps
+    just long enough for the deficit to refill, spreading bursts out instead
+    of letting them hit the provider's 429 path.
+    """
+
+    def __init__(self, rate_per_min: float, burst: Optional[int] = None) -> None:
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_min)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill_locked(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Take ``tokens`` from the bucket, waiting for refill if needed.
+
+        Requests above ``burst`` are clamped to the bucket capacity:
+        refill can never exceed capacity, so an unclamped oversized
+        acquire would sleep and retry forever. The clamped request
+        still pays the full-bucket wait, which is the strongest pacing
+        this bucket can express.
+        """
+        tokens = min(tokens, self.capacity)
+        while True:
+            async with self._lock:
+                self._refill_locked()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    async def set_tokens(self, tokens: float) -> None:
+        """Overwrite the local balance, e.g. from a Convex reconciliation."""
+        async with self._lock:
+            self._tokens = min(self.capacity, tokens)
+            self._updated = time.monotonic()
@@ -0,0 +1,119 @@
+"""Semantic response cache: paraphrase hits via embedding similarity.
+
+The exact-match cache in LLMManager only catches byte-identical prompts.
+Agents also re-ask paraphrases ("summarize X" vs "give me a summary of
+X"); those miss the hash but land within a tight cosine distance of the
+original once embedded. This cache embeds prompts locally with a small
+sentence-transformers model and answers from the cache when similarity
+to a stored prompt clears the threshold - a single matrix-vector product
+against normalized float32 embeddings, microseconds instead of a model
+call.
+
+Entries are namespaced by system prompt so tool prompts sharing a
+template never match across roles, and the whole layer degrades to a
+no-op when sentence-transformers / numpy are not installed.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("llm.semantic_cache")
+
+_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """Embedding-similarity cache over (prompt, response) pairs.
+
+    Per system-prompt namespace it keeps a contiguous ``(N, d)`` float32
+    matrix of normalized prompt embeddings and a parallel list of
+    responses; lookup is one matmul + argmax. Eviction drops the
+    least-recently-hit row when a namespace exceeds ``max_entries``.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 512) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model: Optional[Any] = None
+        self._unavailable = False
+        # namespace -> (embedding rows, responses, last-use counters)
+        self._spaces: Dict[str, Tuple[List[Any], List[Any], List[int]]] = {}
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether the local embedding model could be loaded."""
+        return self._get_model() is not None
+
+    def _get_model(self) -> Optional[Any]:
+        """Load the sentence-transformers model on first use.
+
+        Model load takes ~1s and ~90 MB; done lazily so processes that
+        never hit the semantic layer (or lack the dependency) pay nothing.
+        """
+        if self._model is None and not self._unavailable:
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                self._model = SentenceTransformer(_MODEL_NAME)
+            except ImportError:
+                self._unavailable = True
+                logger.info(
+                    "sentence-transformers not installed; "
+                    "semantic cache disabled"
+                )
+        return self._model
+
+    def _embed(self, prompt: str) -> Optional[Any]:
+        model = self._get_model()
+        if model is None:
+            return None
+        return model.encode(prompt, normalize_embeddings=True)
+
+    def get(self, prompt: str, system_prompt: Optional[str] = None) -> Optional[Any]:
+        """Return the cached response nearest to ``prompt``, if close enough."""
+        space = self._spaces.get(system_prompt or "")
+        if not space or not space[0]:
+            return None
+        query = self._embed(prompt)
+        if query is None:
+            return None
+        import numpy as np
+
+        rows, responses, last_used = space
+        # Embeddings are normalized, so cosine similarity is one matmul.
+        scores = np.vstack(rows) @ query
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            self._clock += 1
+            last_used[best] = self._clock
+            self.hits += 1
+            return responses[best]
+        self.misses += 1
+        return None
+
+    def put(self, prompt: str, response: Any, system_prompt: Optional[str] = None) -> None:
+        """Store ``response`` under ``prompt``'s embedding."""
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return
+        rows, responses, last_used = self._spaces.setdefault(
+            system_prompt or "", ([], [], [])
+        )
+        self._clock += 1
+        rows.append(embedding)
+        responses.append(response)
+        last_used.append(self._clock)
+        if len(rows) > self.max_entries:
+            coldest = last_used.index(min(last_used))
+            del rows[coldest], responses[coldest], last_used[coldest]
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "namespaces": len(self._spaces),
+            "entries": sum(len(s[0]) for s in self._spaces.values()),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,37 @@
+"""Client-side token accounting for prompt budget checks.
+
+Cache lookups and budget prechecks need token counts before the provider
+reports usage. tiktoken's Rust encoder counts a prompt in tens of
+microseconds; the encoder objects are expensive to build, so they are
+memoized per model. Models without a published tiktoken encoding (Claude)
+fall back to cl100k_base, and if tiktoken is not installed at all the
+count degrades to the standard ~4-chars-per-token estimate, which is
+accurate enough for budget warnings.
+"""
+
+import functools
+from typing import Any, Optional
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+
+@functools.lru_cache(maxsize=32)
+def get_encoder(model: str) -> Optional[Any]:
+    """Return the (cached) tiktoken encoder for ``model``, if available."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(model: str, text: str) -> int:
+    """Count (or estimate) the tokens ``text`` encodes to for ``model``."""
+    encoder = get_encoder(model)
+    if encoder is None:
+        return max(1, len(text) // 4)
+    return len(encoder.encode(text))
@@ -0,0 +1,15 @@
+"""Agent tool implementations (web search, semantic search, notes, todos)."""
+
+import functools
+import logging
+
+
+@functools.lru_cache(maxsize=4096)
+def _tool_logger(kind: str, key: str) -> logging.Logger:
+    """Memoized logger lookup shared by the tool classes.
+
+    Agent swarms instantiate thousands of tool objects per run; caching
+    skips rebuilding the name f-string and re-walking the
+    logging.Manager dict for every instance.
+    """
+    return logging.getLogger(f"tools.{kind}.{key}")
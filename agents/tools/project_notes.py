@@ -0,0 +1,222 @@
+"""Project notes tool: durable decisions and context agents leave behind.
+
+Notes live in the Convex ``agentNotes`` table in production; the store
+here is the in-memory stand-in the mock backend uses. IDs are
+content-addressed - a short BLAKE2b digest over the identifying fields - so
+they are deterministic across processes and safe to use as cache keys,
+and two agents creating the same note race to one ID instead of
+inserting duplicates.
+"""
+
+import hashlib
+import math
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import _tool_logger
+
+
+# Validation bounds, hoisted so hot validators compare against constants.
+MAX_NOTE_TITLE = 300
+MAX_NOTE_CONTENT = 50_000
+
+
+class NoteType(StrEnum):
+    DECISION = "decision"
+    CONTEXT = "context"
+    ISSUE = "issue"
+    LEARNING = "learning"
+
+
+@dataclass(slots=True, frozen=True)
+class ProjectNote:
+    """One note as stored in the backend."""
+
+    note_id: str
+    project_id: str
+    agent_id: str
+    note_type: NoteType
+    title: str
+    content: str
+    created_at: int
+    tags: List[str] = field(default_factory=list)
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over short strings.
+
+    Sized from capacity and target false-positive rate; membership tests
+    are a handful of bit probes derived from one BLAKE2b digest (double
+    hashing), with no false negatives for exact entries. Small enough
+    (~60 KB at 50k capacity / 1%) to keep one per tool instance; false
+    positives only cost a scan that finds nothing.
+    """
+
+    def __init__(self, capacity: int = 50_000, error_rate: float = 0.01) -> None:
+        bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._size = max(bits, 64)
+        self._bits = bytearray((self._size + 7) // 8)
+        self._k = max(1, round(self._size / capacity * math.log(2)))
+
+    def _probes(self, token: str) -> Iterator[int]:
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._k):
+            yield (h1 + i * h2) % self._size
+
+    def add(self, token: str) -> None:
+        for pos in self._probes(token):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, token: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._probes(token)
+        )
+
+
+class ProjectNotesTool:
+    """Create, search and summarize notes for one project."""
+
+    def __init__(self, project_id: str, agent_id: str) -> None:
+        self.project_id = project_id
+        self.agent_id = agent_id
+        self.logger = _tool_logger("notes", project_id)
+        self._notes: Dict[str, ProjectNote] = {}
+        # Character trigrams of every note ever written. Lets search_notes
+        # answer definite negatives with a few bit probes - in production,
+        # without the round-trip to the Convex agentNotes query. Trigrams
+        # rather than whole tokens because search is substring-based: a
+        # query can only match a note if every trigram of the query
+        # appears in that note, so an absent trigram proves absence
+        # regardless of punctuation or token boundaries.
+        self._trigram_bloom = _BloomFilter()
+
+    def _note_id(self, title: str, created_at: int) -> str:
+        """Deterministic, collision-resistant note ID.
+
+        BLAKE2b at an 8-byte digest over the identifying fields: stable
+        across processes (unlike builtin hash(), which is seed-randomized),
+        unique per call because created_at is nanosecond-resolution, and
+        the fastest keyed-size hash in the stdlib for short payloads -
+        batch imports hash thousands of these per second.
+        """
+        payload = f"{self.project_id}|{self.agent_id}|{title}|{created_at}"
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+    def validate_note_data(self, title: str, content: str) -> bool:
+        """Reject empty/oversized notes before they hit the backend.
+
+        isspace() instead of strip(): no throwaway string allocation when
+        batch imports run this over thousands of entries.
+        """
+        if not title or title.isspace() or len(title) > MAX_NOTE_TITLE:
+            return False
+        if not content or content.isspace() or len(content) > MAX_NOTE_CONTENT:
+            return False
+        return True
+
+    def create_note(
+        self,
+        title: str,
+        content: str,
+        note_type: NoteType = NoteType.CONTEXT,
+        tags: Optional[List[str]] = None,
+    ) -> Optional[ProjectNote]:
+        """Store one note; returns None when validation rejects it."""
+        if not self.validate_note_data(title, content):
+            self.logger.warning("Rejected invalid note: %r", title[:80])
+            return None
+        created_at = time.time_ns()
+        note = ProjectNote(
+            note_id=f"note_{self._note_id(title, created_at)}",
+            project_id=self.project_id,
+            agent_id=self.agent_id,
+            note_type=note_type,
+            title=title,
+            content=content,
+            created_at=created_at,
+            tags=list(tags) if tags else [],
+        )
+        self._notes[note.note_id] = note
+        self._index_text(title)
+        self._index_text(content)
+        self.logger.info("Created note %s (%s)", note.note_id, note_type)
+        return note
+
+    def create_decision_note(
+        self,
+        decision: str,
+        rationale: str,
+        alternatives: Optional[List[str]] = None,
+    ) -> Optional[ProjectNote]:
+        """Record an architectural/implementation decision."""
+        content = f"Decision: {decision}\n\nRationale: {rationale}"
+        if alternatives:
+            # One C-level join over the list; no per-item formatting loop.
+            content += "\n\nAlternatives considered:\n- " + "\n- ".join(
+                alternatives
+            )
+        return self.create_note(
+            title=decision[:120],
+            content=content,
+            note_type=NoteType.DECISION,
+            tags=["decision"],
+        )
+
+    def _index_text(self, text: str) -> None:
+        """Add every character trigram of ``text`` to the Bloom filter."""
+        lowered = text.lower()
+        add = self._trigram_bloom.add
+        for i in range(len(lowered) - 2):
+            add(lowered[i : i + 3])
+
+    def get_note(self, note_id: str) -> Optional[ProjectNote]:
+        return self._notes.get(note_id)
+
+    def search_notes(
+        self,
+        query: str,
+        note_type: Optional[NoteType] = None,
+    ) -> List[ProjectNote]:
+        """Case-insensitive substring search over titles and content.
+
+        A Bloom filter over every character trigram ever written
+        short-circuits definite negatives - agents routinely probe for
+        notes that do not exist yet, and those probes skip the scan (in
+        production, the backend query) entirely. The trigram check is
+        sound for substring matching: any note containing the query
+        also contains all of the query's trigrams, so one absent
+        trigram proves no note matches. Queries shorter than three
+        characters go straight to the scan.
+        """
+        needle = query.lower()
+        if len(needle) >= 3 and not all(
+            needle[i : i + 3] in self._trigram_bloom
+            for i in range(len(needle) - 2)
+        ):
+            return []
+        results = []
+        for note in self._notes.values():
+            if note_type is not None and note.note_type is not note_type:
+                continue
+            if needle in note.title.lower() or needle in note.content.lower():
+                results.append(note)
+        return results
+
+    def get_project_summary(self) -> Dict[str, Any]:
+        """Counts by note type plus the most recent notes."""
+        by_type: Dict[str, int] = {}
+        for note in self._notes.values():
+            by_type[note.note_type] = by_type.get(note.note_type, 0) + 1
+        recent = sorted(
+            self._notes.values(), key=lambda n: n.created_at, reverse=True
+        )[:5]
+        return {
+            "project_id": self.project_id,
+            "total_notes": len(self._notes),
+            "by_type": by_type,
+            "recent": [n.note_id for n in recent],
+        }
@@ -0,0 +1,104 @@
+"""Semantic codebase search over locally embedded documents.
+
+Candidates are held as one contiguous ``(N, d)`` float32 matrix of
+L2-normalized embeddings; scoring a query is a single ``matrix @ q``
+BLAS call followed by ``argpartition`` for the top-k, so ranking
+thousands of documents costs one vectorized pass instead of a Python
+loop computing cosine per document. Production swaps the in-memory
+matrix for the Convex RAG component index; beyond ~100k documents an
+ANN index (faiss IndexHNSWFlat) replaces the exact matmul.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from . import _tool_logger
+
+_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+@dataclass(slots=True, frozen=True)
+class SemanticResult:
+    """One ranked search hit."""
+
+    path: str
+    snippet: str
+    score: float
+
+
+class SemanticSearchTool:
+    """Embed, index and search project documents for one project."""
+
+    def __init__(self, project_id: str) -> None:
+        self.project_id = project_id
+        self.logger = _tool_logger("semantic_search", project_id)
+        self._model: Optional[Any] = None
+        self._emb_matrix: Optional[Any] = None  # (N, d) float32, rows normalized
+        self._docs: List[Dict[str, str]] = []
+
+    def _get_model(self) -> Any:
+        """Load the sentence-transformers model on first use."""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._model = SentenceTransformer(_MODEL_NAME)
+        return self._model
+
+    def index_documents(self, documents: List[Dict[str, str]]) -> int:
+        """(Re)build the embedding matrix for ``documents``.
+
+        Each document is ``{"path": ..., "content": ...}``. Encoding runs
+        as one batched model call; the resulting rows are normalized so
+        search can use a plain dot product for cosine similarity.
+        """
+        import numpy as np
+
+        self._docs = list(documents)
+        if not self._docs:
+            self._emb_matrix = None
+            return 0
+        model = self._get_model()
+        embeddings = model.encode(
+            [doc["content"] for doc in self._docs],
+            normalize_embeddings=True,
+        )
+        self._emb_matrix = np.asarray(embeddings, dtype=np.float32)
+        self.logger.info("Indexed %d documents", len(self._docs))
+        return len(self._docs)
+
+    def search_codebase(
+        self, query: str, max_results: int = 5
+    ) -> List[SemanticResult]:
+        """Top ``max_results`` documents by cosine similarity to ``query``.
+
+        One matmul scores every candidate; argpartition selects the top-k
+        in O(N) before the final O(k log k) sort.
+        """
+        if self._emb_matrix is None:
+            return []
+        import numpy as np
+
+        query_vec = self._get_model().encode(query, normalize_embeddings=True)
+        scores = self._emb_matrix @ np.asarray(query_vec, dtype=np.float32)
+        k = min(max_results, len(self._docs))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            SemanticResult(
+                path=self._docs[i]["path"],
+                snippet=self._docs[i]["content"][:200],
+                score=float(scores[i]),
+            )
+            for i in top
+        ]
+
+    def get_index_stats(self) -> Dict[str, Any]:
+        return {
+            "project_id": self.project_id,
+            "documents": len(self._docs),
+            "dimensions": (
+                int(self._emb_matrix.shape[1])
+                if self._emb_matrix is not None
+                else 0
+            ),
+        }
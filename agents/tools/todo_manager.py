@@ -0,0 +1,146 @@
+"""Todo manager tool: task lists agents maintain while working a project.
+
+Backed by the Convex ``agentTodos`` table in production; this module
+keeps the mock in-memory store the rest of the pipeline exercises. Todo
+IDs are content-addressed the same way note IDs are (short BLAKE2b
+over identifying fields + nanosecond timestamp), so they are
+deterministic across processes and never collide the way builtin
+hash()-derived IDs did.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, Dict, List, Optional
+
+from . import _tool_logger
+
+
+# Validation bounds, hoisted so hot validators compare against constants.
+MAX_TODO_TITLE = 200
+MAX_TODO_DESC = 2_000
+
+
+class TodoStatus(StrEnum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+class TodoPriority(StrEnum):
+    LOW = "low"
+    NORMAL = "normal"
+    HIGH = "high"
+    URGENT = "urgent"
+
+
+# Slotted but not frozen: update_status mutates status in place.
+@dataclass(slots=True)
+class TodoItem:
+    """One todo as stored in the backend."""
+
+    todo_id: str
+    project_id: str
+    agent_id: str
+    title: str
+    description: str
+    status: TodoStatus
+    priority: TodoPriority
+    created_at: int
+    depends_on: List[str] = field(default_factory=list)
+
+
+class TodoManagerTool:
+    """Create and track todos for one agent working one project."""
+
+    def __init__(self, project_id: str, agent_id: str) -> None:
+        self.project_id = project_id
+        self.agent_id = agent_id
+        self.logger = _tool_logger("todos", project_id)
+        self._todos: Dict[str, TodoItem] = {}
+
+    def _todo_id(self, title: str, created_at: int) -> str:
+        """Deterministic 8-byte BLAKE2b ID; see ProjectNotesTool._note_id."""
+        payload = f"{self.project_id}|{self.agent_id}|{title}|{created_at}"
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+    def validate_todo_data(self, title: str, description: str) -> bool:
+        """Reject empty/oversized todos before they hit the backend.
+
+        isspace() instead of strip(): no throwaway string allocation when
+        reconciliation runs this over the whole task queue.
+        """
+        if not title or title.isspace() or len(title) > MAX_TODO_TITLE:
+            return False
+        if len(description) > MAX_TODO_DESC:
+            return False
+        return True
+
+    def create_todo(
+        self,
+        title: str,
+        description: str = "",
+        priority: TodoPriority = TodoPriority.NORMAL,
+        depends_on: Optional[List[str]] = None,
+    ) -> Optional[TodoItem]:
+        """Store one todo; returns None when validation rejects it."""
+        if not self.validate_todo_data(title, description):
+            self.logger.warning("Rejected invalid todo: %r", title[:80])
+            return None
+        created_at = time.time_ns()
+        todo = TodoItem(
+            todo_id=f"todo_{self._todo_id(title, created_at)}",
+            project_id=self.project_id,
+            agent_id=self.agent_id,
+            title=title,
+            description=description,
+            status=TodoStatus.PENDING,
+            priority=priority,
+            created_at=created_at,
+            depends_on=list(depends_on) if depends_on else [],
+        )
+        self._todos[todo.todo_id] = todo
+        self.logger.info("Created todo %s (%s)", todo.todo_id, priority)
+        return todo
+
+    def update_status(self, todo_id: str, status: TodoStatus) -> bool:
+        todo = self._todos.get(todo_id)
+        if todo is None:
+            return False
+        todo.status = status
+        self.logger.info("Todo %s -> %s", todo_id, status)
+        return True
+
+    def get_todo(self, todo_id: str) -> Optional[TodoItem]:
+        return self._todos.get(todo_id)
+
+    def list_todos(
+        self,
+        status: Optional[TodoStatus] = None,
+        priority: Optional[TodoPriority] = None,
+    ) -> List[TodoItem]:
+        """Todos filtered by status and/or priority, newest first."""
+        todos = [
+            todo
+            for todo in self._todos.values()
+            if (status is None or todo.status is status)
+            and (priority is None or todo.priority is priority)
+        ]
+        todos.sort(key=lambda t: t.created_at, reverse=True)
+        return todos
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Completion counts for the project's todo list."""
+        by_status: Dict[str, int] = {}
+        for todo in self._todos.values():
+            by_status[todo.status] = by_status.get(todo.status, 0) + 1
+        total = len(self._todos)
+        done = by_status.get(TodoStatus.COMPLETED, 0)
+        return {
+            "project_id": self.project_id,
+            "total": total,
+            "by_status": by_status,
+            "percent_complete": (100 * done // total) if total else 0,
+        }
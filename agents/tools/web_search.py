@@ -0,0 +1,114 @@
+"""Web search tool for agents researching libraries, errors and docs.
+
+Results are currently simulated (swap the mock for a real search API
+behind the same interface). Query enhancement - folding the project's
+tech stack and type into the query - is memoized per context, since an
+agent typically issues dozens of searches per task against the same
+project context and the suffix never changes within a session.
+"""
+
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from . import _tool_logger
+
+
+# Validation bound, hoisted so the hot validator compares against a constant.
+MAX_QUERY = 500
+
+# At most this many tech-stack terms are folded into an enhanced query;
+# beyond that the suffix stops improving relevance and only adds length.
+MAX_CONTEXT_TERMS = 6
+
+
+@dataclass(slots=True, frozen=True)
+class SearchResult:
+    """One search hit."""
+
+    title: str
+    url: str
+    snippet: str
+    rank: int
+
+
+@functools.lru_cache(maxsize=128)
+def _context_suffix(tech_stack: tuple, project_type: str) -> str:
+    """Build the query-enhancement suffix for one project context.
+
+    Hashable inputs (sorted tech-stack tuple + project type) so repeated
+    searches against the same context pay a cache lookup instead of
+    re-joining the terms every call. Terms are deduped (order-preserving)
+    and capped at MAX_CONTEXT_TERMS so a 20-item stack cannot balloon the
+    query past upstream length limits.
+    """
+    terms = list(dict.fromkeys(tech_stack))[:MAX_CONTEXT_TERMS]
+    if project_type:
+        terms.append(project_type)
+    return " ".join(terms)
+
+
+class WebSearchTool:
+    """Issue (mocked) web searches on behalf of an agent."""
+
+    def __init__(self, agent_id: str) -> None:
+        self.agent_id = agent_id
+        self.logger = _tool_logger("web_search", agent_id)
+        self._search_count = 0
+
+    def validate_search_query(self, query: str) -> bool:
+        # isspace() instead of strip(): no throwaway string allocation.
+        if not query or query.isspace() or len(query) > MAX_QUERY:
+            return False
+        return True
+
+    def validate_search_context(self, context: Dict[str, Any]) -> bool:
+        tech_stack = context.get("tech_stack", [])
+        if not isinstance(tech_stack, (list, tuple)):
+            return False
+        return all(isinstance(term, str) for term in tech_stack)
+
+    async def search(
+        self, query: str, max_results: int = 5
+    ) -> List[SearchResult]:
+        """Run one search; empty list on an invalid query."""
+        if not self.validate_search_query(query):
+            self.logger.warning("Rejected invalid query: %r", query[:80])
+            return []
+        self._search_count += 1
+        return self._mock_search_results(query, max_results)
+
+    async def search_with_context(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        max_results: int = 5,
+    ) -> List[SearchResult]:
+        """Search with the project's tech stack folded into the query."""
+        if context and self.validate_search_context(context):
+            suffix = _context_suffix(
+                tuple(sorted(context.get("tech_stack", []))),
+                context.get("project_type", ""),
+            )
+            # Enhance only within the validator's budget: a query already
+            # near MAX_QUERY goes out as-is rather than being rejected.
+            if suffix and len(query) + 1 + len(suffix) <= MAX_QUERY:
+                query = f"{query} {suffix}"
+        return await self.search(query, max_results)
+
+    def _mock_search_results(
+        self, query: str, max_results: int
+    ) -> List[SearchResult]:
+        """Simulated results - replace with the real search API call."""
+        return [
+            SearchResult(
+                title=f"Result {rank + 1} for: {query[:60]}",
+                url=f"https://example.com/{self.agent_id}/{rank}",
+                snippet=f"Snippet about {query[:80]}",
+                rank=rank + 1,
+            )
+            for rank in range(max_results)
+        ]
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        return {"agent_id": self.agent_id, "searches": self._search_count}
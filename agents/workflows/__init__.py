@@ -0,0 +1 @@
+"""Development workflow definitions and their coordinator."""
@@ -0,0 +1,52 @@
+"""Durable per-step checkpoints so interrupted workflows resume, not replay.
+
+The local backend is an append-only file of orjson lines - each
+checkpoint costs one O(size-of-one-result) append, never a rewrite of
+the full workflow state - written off the event loop. Production swaps
+this for the Convex workflow-state table behind the same two calls.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List
+
+import orjson
+
+
+class CheckpointStore:
+    """Append-only store of completed step results, keyed by workflow."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = asyncio.Lock()
+
+    async def put(self, workflow_id: str, payload: Dict[str, Any]) -> None:
+        """Append one completed step's result for ``workflow_id``."""
+        line = orjson.dumps({"workflow_id": workflow_id, "result": payload})
+
+        def append() -> None:
+            with open(self.path, "ab") as fh:
+                fh.write(line + b"\n")
+
+        async with self._lock:
+            await asyncio.to_thread(append)
+
+    async def load(self, workflow_id: str) -> List[Dict[str, Any]]:
+        """All checkpointed results for ``workflow_id``, oldest first."""
+
+        def read() -> bytes:
+            try:
+                return self.path.read_bytes()
+            except OSError:
+                return b""
+
+        data = await asyncio.to_thread(read)
+        results = []
+        for line in data.splitlines():
+            if not line:
+                continue
+            entry = orjson.loads(line)
+            if entry["workflow_id"] == workflow_id:
+                results.append(entry["result"])
+        return results
@@ -0,0 +1,426 @@
+"""The end-to-end development workflow one project runs through.
+
+Steps delegate to Convex workpools (mocked here) and are pure I/O waits
+from this process's perspective, so independent steps run concurrently:
+the step-dependency DAG is scheduled Kahn-style, launching every step
+whose dependencies are complete and waiting on the first completion.
+Wall time is the critical path (architecture -> tasks -> coding -> QA ->
+deployment) rather than the sum of all steps - coding and testing, for
+example, overlap.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Final, List, Optional, Set
+
+import orjson
+
+from .checkpoints import CheckpointStore
+from .workpool_cache import WorkpoolCache, workpool_key
+
+DelegateFn = Callable[["WorkflowStep", Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# Retry pacing: attempt k sleeps base * 2**k plus up to one base of
+# jitter, capped so a long outage never strands a step in minutes-long
+# sleeps between its final attempts.
+_BACKOFF_BASE = 0.1
+_BACKOFF_CAP = 5.0
+
+
+@functools.lru_cache(maxsize=1024)
+def _workflow_logger(project_id: str, workflow_id: str) -> logging.Logger:
+    """Memoized per-workflow logger, skipping the name build and
+    registry lookup when the same workflow is constructed again
+    (e.g. on resume)."""
+    return logging.getLogger(f"workflow.{project_id}.{workflow_id}")
+
+
+class TransientError(Exception):
+    """A step failure worth retrying - timeouts, rate limits, flaky I/O."""
+
+
+class PermanentError(Exception):
+    """A deterministic step failure; retrying would repeat the outcome."""
+
+
+class WorkflowStep(Enum):
+    ARCHITECTURE_DESIGN = "architecture_design"
+    TASK_CREATION = "task_creation"
+    CODING = "coding"
+    TESTING = "testing"
+    QA_VALIDATION = "qa_validation"
+    DEPLOYMENT = "deployment"
+
+
+# Which Convex workpool serves each step. Module-level so the routing
+# is resolved once, not rebuilt per delegation, and so that steps served
+# by the same pool (coding and testing both run in the code-execution
+# sandbox) share one batcher in the coordinator.
+_WORKPOOL_MAP: Final[Dict[WorkflowStep, str]] = {
+    WorkflowStep.ARCHITECTURE_DESIGN: "architecture",
+    WorkflowStep.TASK_CREATION: "planning",
+    WorkflowStep.CODING: "code_execution",
+    WorkflowStep.TESTING: "code_execution",
+    WorkflowStep.QA_VALIDATION: "qa",
+    WorkflowStep.DEPLOYMENT: "deployment",
+}
+
+
+class WorkflowStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+# Enum .value goes through a descriptor; hot serialization sites
+# (progress snapshots, checkpoints, the coordinator summary) look the
+# strings up in these precomputed tables instead.
+_STEP_VALUES: Final[Dict[WorkflowStep, str]] = {s: s.value for s in WorkflowStep}
+_STATUS_VALUES: Final[Dict[WorkflowStatus, str]] = {
+    s: s.value for s in WorkflowStatus
+}
+
+
+@dataclass(slots=True)
+class WorkflowConfig:
+    """Identity and step list for one workflow run."""
+
+    workflow_id: str
+    project_id: str
+    steps: List[WorkflowStep] = field(
+        default_factory=lambda: list(WorkflowStep)
+    )
+    max_retries: int = 2
+
+
+@dataclass(slots=True)
+class StepResult:
+    """Outcome of one workflow step."""
+
+    step: WorkflowStep
+    status: WorkflowStatus
+    output: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 1
+    duration_ms: float = 0.0
+
+
+class DevelopmentWorkflow:
+    """Executes the development steps for one project."""
+
+    # Which steps must complete before each step may start. Coding and
+    # testing share a dependency and run in parallel.
+    STEP_DEPENDENCIES: Dict[WorkflowStep, Set[WorkflowStep]] = {
+        WorkflowStep.ARCHITECTURE_DESIGN: set(),
+        WorkflowStep.TASK_CREATION: {WorkflowStep.ARCHITECTURE_DESIGN},
+        WorkflowStep.CODING: {WorkflowStep.TASK_CREATION},
+        WorkflowStep.TESTING: {WorkflowStep.TASK_CREATION},
+        WorkflowStep.QA_VALIDATION: {
+            WorkflowStep.CODING,
+            WorkflowStep.TESTING,
+        },
+        WorkflowStep.DEPLOYMENT: {WorkflowStep.QA_VALIDATION},
+    }
+
+    # Steps whose outputs are side effects rather than pure functions of
+    # their inputs; these always reach the workpool.
+    UNCACHEABLE_STEPS: Set[WorkflowStep] = {WorkflowStep.DEPLOYMENT}
+
+    def __init__(
+        self,
+        config: WorkflowConfig,
+        workpool_cache: Optional[WorkpoolCache] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        workpool_delegate: Optional[DelegateFn] = None,
+    ) -> None:
+        self.config = config
+        self._status = WorkflowStatus.PENDING
+        self.step_results: List[StepResult] = []
+        # Progress polling is frequent (dashboards poll every few hundred
+        # ms); the serialized snapshot is cached and rebuilt only when a
+        # step lands or the status moves, with the completed count kept
+        # incrementally instead of re-scanning step_results.
+        self._completed_count = 0
+        self._progress_cache: Optional[Dict[str, Any]] = None
+        self._progress_json: Optional[bytes] = None
+        self.workpool_cache = workpool_cache
+        self.checkpoint_store = checkpoint_store
+        self.workpool_delegate = workpool_delegate
+        self.logger = _workflow_logger(config.project_id, config.workflow_id)
+
+    @property
+    def status(self) -> WorkflowStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: WorkflowStatus) -> None:
+        self._status = value
+        self._invalidate_progress()
+
+    def _invalidate_progress(self) -> None:
+        self._progress_cache = None
+        self._progress_json = None
+
+    async def execute(self) -> WorkflowStatus:
+        """Run all configured steps, honoring the dependency DAG."""
+        self.status = WorkflowStatus.RUNNING
+        try:
+            await self._execute_parallel()
+        except asyncio.CancelledError:
+            self.status = WorkflowStatus.CANCELLED
+            raise
+        if any(r.status is WorkflowStatus.FAILED for r in self.step_results):
+            self.status = WorkflowStatus.FAILED
+        else:
+            self.status = WorkflowStatus.COMPLETED
+        return self.status
+
+    async def _execute_parallel(self) -> None:
+        """Kahn-style DAG scheduler over the configured steps.
+
+        Every step whose (configured) dependencies are complete runs as
+        its own task; completions release their dependents. The first
+        failed step cancels everything still in flight - downstream
+        steps could only act on broken inputs.
+        """
+        configured = set(self.config.steps)
+        # Steps already completed (a resumed run rehydrates them) are
+        # neither scheduled nor counted as blockers.
+        completed = {
+            r.step
+            for r in self.step_results
+            if r.status is WorkflowStatus.COMPLETED
+        }
+        # Only dependencies that are actually configured gate a step, so
+        # partial workflows (e.g. re-running coding onward) still schedule.
+        waiting: Dict[WorkflowStep, Set[WorkflowStep]] = {
+            step: (self.STEP_DEPENDENCIES.get(step, set()) & configured)
+            - completed
+            for step in self.config.steps
+            if step not in completed
+        }
+        running: Dict[asyncio.Task, WorkflowStep] = {}
+
+        def launch_ready() -> None:
+            for step, deps in list(waiting.items()):
+                if not deps:
+                    del waiting[step]
+                    task = asyncio.create_task(
+                        self._execute_step(step), name=f"step-{step.value}"
+                    )
+                    running[task] = step
+
+        launch_ready()
+        failed = False
+        while running:
+            done, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                step = running.pop(task)
+                result = task.result()
+                await self._record(result)
+                if result.status is WorkflowStatus.FAILED:
+                    failed = True
+                else:
+                    for deps in waiting.values():
+                        deps.discard(step)
+            if failed:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                self.logger.error(
+                    "Workflow %s aborted; %d steps never ran",
+                    self.config.workflow_id,
+                    len(waiting),
+                )
+                return
+            launch_ready()
+
+    async def _execute_sequential(self) -> None:
+        """One-at-a-time fallback used when step ordering must be strict."""
+        completed = {
+            r.step
+            for r in self.step_results
+            if r.status is WorkflowStatus.COMPLETED
+        }
+        for step in self.config.steps:
+            if step in completed:
+                continue
+            result = await self._execute_step(step)
+            await self._record(result)
+            if result.status is WorkflowStatus.FAILED:
+                break
+
+    async def _record(self, result: StepResult) -> None:
+        """Track one finished step, checkpointing completions durably."""
+        self.step_results.append(result)
+        self._invalidate_progress()
+        if result.status is WorkflowStatus.COMPLETED:
+            self._completed_count += 1
+        if (
+            self.checkpoint_store is not None
+            and result.status is WorkflowStatus.COMPLETED
+        ):
+            await self.checkpoint_store.put(
+                self.config.workflow_id,
+                {
+                    "step": _STEP_VALUES[result.step],
+                    "status": _STATUS_VALUES[result.status],
+                    "output": result.output,
+                    "attempts": result.attempts,
+                    "duration_ms": result.duration_ms,
+                },
+            )
+
+    async def _execute_step(self, step: WorkflowStep) -> StepResult:
+        """Run one step with retries; failures exhaust max_retries first.
+
+        Returns exactly one StepResult - the final attempt. Intermediate
+        failed attempts are logged, never recorded, so each step
+        contributes at most one entry to ``step_results``.
+        """
+        attempts = 0
+        started = time.monotonic()
+        inputs = {"project_id": self.config.project_id}
+        while True:
+            attempts += 1
+            try:
+                output = await self._run_step(step, inputs)
+            except Exception as exc:
+                # Deterministic failures are not retried: re-running the
+                # same step on the same inputs would repeat the outcome
+                # while burning workpool capacity.
+                retryable = not isinstance(exc, PermanentError)
+                if retryable and attempts <= self.config.max_retries:
+                    delay = min(
+                        _BACKOFF_BASE * 2 ** (attempts - 1)
+                        + random.random() * _BACKOFF_BASE,
+                        _BACKOFF_CAP,
+                    )
+                    self.logger.warning(
+                        "Step %s attempt %d failed: %s; retrying in %.2fs",
+                        step.value,
+                        attempts,
+                        exc,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                self.logger.error(
+                    "Step %s failed after %d attempts: %s",
+                    step.value,
+                    attempts,
+                    exc,
+                )
+                return StepResult(
+                    step=step,
+                    status=WorkflowStatus.FAILED,
+                    output={"error": str(exc)},
+                    attempts=attempts,
+                    duration_ms=(time.monotonic() - started) * 1000,
+                )
+            return StepResult(
+                step=step,
+                status=WorkflowStatus.COMPLETED,
+                output=output,
+                attempts=attempts,
+                duration_ms=(time.monotonic() - started) * 1000,
+            )
+
+    async def _run_step(
+        self, step: WorkflowStep, inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run one step through the workpool cache when it applies.
+
+        A step is served from cache when its (step, inputs) signature
+        was already computed - by an earlier retry, or by another
+        workflow of the same coordinator working the same project.
+        Deployment and other side-effecting steps bypass the cache.
+        """
+        if self.workpool_cache is None or step in self.UNCACHEABLE_STEPS:
+            return await self._delegate_to_workpool(step, inputs)
+        key = workpool_key(step.value, inputs)
+        return await self.workpool_cache.get_or_compute(
+            key, lambda: self._delegate_to_workpool(step, inputs)
+        )
+
+    async def _delegate_to_workpool(
+        self, step: WorkflowStep, inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Hand one step to its Convex workpool.
+
+        A coordinator-supplied delegate (which micro-batches concurrent
+        calls across workflows) takes precedence; standalone workflows
+        fall back to a direct - here mocked - round-trip.
+        """
+        if self.workpool_delegate is not None:
+            return await self.workpool_delegate(step, inputs)
+        await asyncio.sleep(0.01)  # Simulate workpool round-trip
+        return {"step": step.value, "result": f"{step.value} completed"}
+
+    async def resume(self) -> WorkflowStatus:
+        """Resume an interrupted workflow from its last checkpoint.
+
+        Completed steps rehydrate from the checkpoint store and are
+        skipped by the scheduler, so the cost of a resume is the
+        remaining steps, not a replay from architecture design. Without
+        a store this degrades to a fresh run.
+        """
+        self.step_results = []
+        self._completed_count = 0
+        self._invalidate_progress()
+        if self.checkpoint_store is not None:
+            for payload in await self.checkpoint_store.load(
+                self.config.workflow_id
+            ):
+                self.step_results.append(
+                    StepResult(
+                        step=WorkflowStep(payload["step"]),
+                        status=WorkflowStatus(payload["status"]),
+                        output=payload.get("output", {}),
+                        attempts=payload.get("attempts", 1),
+                        duration_ms=payload.get("duration_ms", 0.0),
+                    )
+                )
+            self._completed_count = len(self.step_results)
+            if self.step_results:
+                self.logger.info(
+                    "Resuming workflow %s: %d steps already complete",
+                    self.config.workflow_id,
+                    len(self.step_results),
+                )
+        return await self.execute()
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Completion fraction - O(1), cached between state changes."""
+        if self._progress_cache is not None:
+            return self._progress_cache
+        completed = self._completed_count
+        self._progress_cache = {
+            "workflow_id": self.config.workflow_id,
+            "status": _STATUS_VALUES[self.status],
+            "completed_steps": completed,
+            "total_steps": len(self.config.steps),
+            "percent": (100 * completed // len(self.config.steps))
+            if self.config.steps
+            else 0,
+        }
+        return self._progress_cache
+
+    def get_progress_json(self) -> bytes:
+        """``get_progress`` pre-serialized with orjson.
+
+        Status endpoints can hand these bytes straight to the response
+        body, skipping a per-poll json round-trip; the serialization
+        shares the progress cache's invalidation.
+        """
+        if self._progress_json is None:
+            self._progress_json = orjson.dumps(self.get_progress())
+        return self._progress_json
@@ -0,0 +1,317 @@
+"""Tracks and runs development workflows across a deployment's projects.
+
+The coordinator owns the live DevelopmentWorkflow instances, hands out
+workflow IDs, and answers status/progress queries for the dashboard.
+Lookups by project and by status go through secondary indexes kept in
+lock-step with the primary dict, so status polls cost O(result-size)
+instead of a scan over every workflow the deployment has ever started;
+cleanup pops a completion-time min-heap instead of re-scanning.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import orjson
+
+from ..llm.batcher import AsyncBatcher
+from .development_workflow import (
+    _STATUS_VALUES,
+    _WORKPOOL_MAP,
+    DevelopmentWorkflow,
+    WorkflowConfig,
+    WorkflowStatus,
+    WorkflowStep,
+)
+from .workpool_cache import WorkpoolCache
+
+# Admission and completion times are monotonic nanoseconds: immune to
+# wall-clock jumps (which would break age-based cleanup) and compared
+# with pure integer arithmetic.
+_now_ns = time.monotonic_ns
+
+# Statuses a workflow cannot leave; reaching one makes it eligible for
+# age-based cleanup.
+_TERMINAL_STATUSES = frozenset(
+    {
+        WorkflowStatus.COMPLETED,
+        WorkflowStatus.FAILED,
+        WorkflowStatus.CANCELLED,
+    }
+)
+
+
+class WorkflowCoordinator:
+    """Start, query and clean up workflows."""
+
+    def __init__(self, max_concurrent_workflows: int = 5) -> None:
+        self.active_workflows: Dict[str, DevelopmentWorkflow] = {}
+        # FIFO of admitted-but-not-yet-running workflow IDs; deque gives
+        # O(1) popleft where a list's pop(0) is O(N) per dequeue.
+        self.workflow_queue: Deque[str] = deque()
+        self._started_at: Dict[str, int] = {}
+        # Secondary indexes over active_workflows. All mutations flow
+        # through _insert/_set_status/_remove so they never drift.
+        self._by_project: Dict[str, Set[str]] = {}
+        self._by_status: Dict[WorkflowStatus, Set[str]] = {
+            status: set() for status in WorkflowStatus
+        }
+        # The status bucket each workflow currently sits in. Workflows
+        # mutate their own .status mid-run; the index moves only through
+        # _set_status, so this records which bucket to discard from.
+        self._indexed_status: Dict[str, WorkflowStatus] = {}
+        # (finished_at_ns, workflow_id) min-heap; entries for workflows
+        # that were since removed are dropped lazily when popped.
+        self._completed_heap: List[Tuple[int, str]] = []
+        # Shared across all workflows this coordinator runs: identical
+        # (step, inputs) signatures are computed once per deployment.
+        # Workflows run as background tasks; the semaphore bounds how
+        # many execute at once, the rest wait their turn inside _run_one.
+        self._sem = asyncio.Semaphore(max_concurrent_workflows)
+        self._admit_lock = asyncio.Lock()
+        self._running_tasks: Dict[str, asyncio.Task] = {}
+        # Set when a workflow reaches a terminal status, so callers can
+        # await completion instead of polling status queries.
+        self._done_events: Dict[str, asyncio.Event] = {}
+        # Progress accessor captured per workflow at admission. Status
+        # queries call through it, so future workflow types plug in by
+        # exposing their own accessor rather than growing an isinstance
+        # chain here.
+        self._progress_fns: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        # One micro-batcher per workpool: delegations from concurrent
+        # workflows that land within the window ride one bulk RPC.
+        self._batchers: Dict[str, AsyncBatcher] = {}
+        self.cache = WorkpoolCache()
+        self.logger = logging.getLogger("workflow.coordinator")
+        self._eager_tasks_enabled = False
+
+    def _enable_eager_tasks(self) -> None:
+        """Opt the running loop into eager task execution (Python 3.12+).
+
+        Coroutines that complete without suspending - cache hits, status
+        queries - then run inline instead of taking a trip through the
+        ready queue. On 3.11 the factory does not exist and this is a
+        no-op; create_task behavior is unchanged.
+        """
+        if self._eager_tasks_enabled:
+            return
+        self._eager_tasks_enabled = True
+        factory = getattr(asyncio, "eager_task_factory", None)
+        if factory is not None:
+            asyncio.get_running_loop().set_task_factory(factory)
+
+    def _insert(self, workflow: DevelopmentWorkflow) -> None:
+        workflow_id = workflow.config.workflow_id
+        self.active_workflows[workflow_id] = workflow
+        self._started_at[workflow_id] = _now_ns()
+        self._by_project.setdefault(workflow.config.project_id, set()).add(
+            workflow_id
+        )
+        self._by_status[workflow.status].add(workflow_id)
+        self._indexed_status[workflow_id] = workflow.status
+        self._done_events[workflow_id] = asyncio.Event()
+        self._progress_fns[workflow_id] = workflow.get_progress
+
+    def _set_status(self, workflow_id: str, status: WorkflowStatus) -> None:
+        """Move one workflow between status index buckets."""
+        self._by_status[self._indexed_status[workflow_id]].discard(workflow_id)
+        self._by_status[status].add(workflow_id)
+        self._indexed_status[workflow_id] = status
+        if status in _TERMINAL_STATUSES:
+            heapq.heappush(self._completed_heap, (_now_ns(), workflow_id))
+
+    def _remove(self, workflow_id: str) -> None:
+        workflow = self.active_workflows.pop(workflow_id, None)
+        if workflow is None:
+            return
+        self._started_at.pop(workflow_id, None)
+        self._done_events.pop(workflow_id, None)
+        self._progress_fns.pop(workflow_id, None)
+        self._by_status[self._indexed_status.pop(workflow_id)].discard(
+            workflow_id
+        )
+        project_ids = self._by_project.get(workflow.config.project_id)
+        if project_ids is not None:
+            project_ids.discard(workflow_id)
+            if not project_ids:
+                del self._by_project[workflow.config.project_id]
+
+    async def start_workflow(self, config: WorkflowConfig) -> str:
+        """Admit one workflow and run it in the background.
+
+        Returns the workflow ID immediately; execution happens on its
+        own task, at most ``max_concurrent_workflows`` at a time. Track
+        outcome via ``get_workflow``/``get_status_summary``.
+
+        Admission is idempotent per workflow ID: a client retry of an
+        already-admitted workflow (e.g. after a network blip) returns
+        the existing run instead of overwriting it and double-enqueuing.
+        """
+        self._enable_eager_tasks()
+        async with self._admit_lock:
+            if config.workflow_id in self.active_workflows:
+                self.logger.info(
+                    "Workflow %s already admitted; coalescing duplicate start",
+                    config.workflow_id,
+                )
+                return config.workflow_id
+            workflow = DevelopmentWorkflow(
+                config,
+                workpool_cache=self.cache,
+                workpool_delegate=self._delegate_batched,
+            )
+            self._insert(workflow)
+            self.workflow_queue.append(config.workflow_id)
+            self._process_queue()
+        return config.workflow_id
+
+    def _process_queue(self) -> None:
+        """Launch a runner task for every queued workflow."""
+        while self.workflow_queue:
+            workflow_id = self.workflow_queue.popleft()
+            task = asyncio.create_task(
+                self._run_one(workflow_id), name=f"workflow-{workflow_id}"
+            )
+            self._running_tasks[workflow_id] = task
+            task.add_done_callback(
+                lambda t, wid=workflow_id: self._on_done(wid, t)
+            )
+
+    async def _run_one(self, workflow_id: str) -> WorkflowStatus:
+        workflow = self.active_workflows[workflow_id]
+        async with self._sem:
+            self.logger.info(
+                "Starting workflow %s for project %s",
+                workflow_id,
+                workflow.config.project_id,
+            )
+            self._set_status(workflow_id, WorkflowStatus.RUNNING)
+            return await workflow.execute()
+
+    def _on_done(self, workflow_id: str, task: asyncio.Task) -> None:
+        """Reconcile indexes with a finished runner task."""
+        self._running_tasks.pop(workflow_id, None)
+        if workflow_id not in self.active_workflows:
+            return  # removed while running (cleanup raced completion)
+        if task.cancelled():
+            self._set_status(workflow_id, WorkflowStatus.CANCELLED)
+        elif (exc := task.exception()) is not None:
+            self.logger.error(
+                "Workflow %s crashed: %s", workflow_id, exc
+            )
+            self._set_status(workflow_id, WorkflowStatus.FAILED)
+        else:
+            self._set_status(workflow_id, task.result())
+        self._done_events[workflow_id].set()
+
+    async def wait_for_completion(
+        self, workflow_id: str, timeout: Optional[float] = None
+    ) -> WorkflowStatus:
+        """Block until ``workflow_id`` reaches a terminal status.
+
+        Event-driven - no status polling. Returns the terminal status;
+        raises KeyError for unknown IDs and asyncio.TimeoutError when
+        ``timeout`` elapses first.
+        """
+        event = self._done_events[workflow_id]
+        await asyncio.wait_for(event.wait(), timeout)
+        return self._indexed_status[workflow_id]
+
+    async def _delegate_batched(
+        self, step: WorkflowStep, inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Workpool delegate shared by this coordinator's workflows.
+
+        Calls for the same workpool arriving within the batch window
+        coalesce into one bulk RPC - five workflows hitting the coding
+        workpool near-simultaneously cost one round-trip, not five.
+        """
+        workpool = _WORKPOOL_MAP[step]
+        batcher = self._batchers.get(workpool)
+        if batcher is None:
+            batcher = AsyncBatcher(
+                partial(self._bulk_delegate, workpool),
+                max_batch=16,
+                max_wait_ms=2.0,
+            )
+            self._batchers[workpool] = batcher
+        return await batcher.submit({"step": step.value, "inputs": inputs})
+
+    async def _bulk_delegate(
+        self, workpool: str, payloads: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """One bulk workpool RPC carrying N payloads - mocked for now."""
+        await asyncio.sleep(0.01)  # Simulate workpool round-trip
+        return [
+            {"step": payload["step"], "result": f"{payload['step']} completed"}
+            for payload in payloads
+        ]
+
+    def cancel_workflow(self, workflow_id: str) -> bool:
+        """Cancel a running workflow; returns False if it is not running."""
+        task = self._running_tasks.get(workflow_id)
+        if task is None:
+            return False
+        return task.cancel()
+
+    def get_workflow(self, workflow_id: str) -> Optional[DevelopmentWorkflow]:
+        return self.active_workflows.get(workflow_id)
+
+    def get_workflow_status(
+        self, workflow_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Progress snapshot for one workflow, or None if unknown."""
+        progress_fn = self._progress_fns.get(workflow_id)
+        return progress_fn() if progress_fn is not None else None
+
+    def get_project_workflows(self, project_id: str) -> List[str]:
+        """IDs of this project's workflows - O(result-size) via the index."""
+        return list(self._by_project.get(project_id, ()))
+
+    def list_workflows(
+        self, status: Optional[WorkflowStatus] = None
+    ) -> List[str]:
+        """IDs of workflows, optionally filtered by status."""
+        if status is None:
+            return list(self.active_workflows)
+        return list(self._by_status[status])
+
+    def get_status_summary(self) -> Dict[str, Any]:
+        """Counts per status - index set sizes, no scan."""
+        return {
+            "total": len(self.active_workflows),
+            "by_status": {
+                _STATUS_VALUES[status]: len(ids)
+                for status, ids in self._by_status.items()
+                if ids
+            },
+        }
+
+    def get_status_summary_json(self) -> bytes:
+        """``get_status_summary`` pre-serialized with orjson.
+
+        Bytes go straight onto the wire as an application/json body,
+        skipping the framework's own serializer.
+        """
+        return orjson.dumps(self.get_status_summary())
+
+    def cleanup_completed(self, max_age_ms: int = 3_600_000) -> int:
+        """Drop finished workflows older than ``max_age_ms``.
+
+        Pops the completion-time heap until the newest-too-old boundary,
+        so cost tracks the number of evictions, not the table size.
+        """
+        max_age_ns = max_age_ms * 1_000_000
+        now = _now_ns()
+        removed = 0
+        while self._completed_heap and now - self._completed_heap[0][0] > max_age_ns:
+            _, workflow_id = heapq.heappop(self._completed_heap)
+            if self._indexed_status.get(workflow_id) not in _TERMINAL_STATUSES:
+                continue  # stale heap entry (removed or restarted since)
+            self._remove(workflow_id)
+            removed += 1
+        return removed
@@ -0,0 +1,85 @@
+"""Content-addressed cache for workpool step results.
+
+A workpool call is a function of the step and its inputs; retried steps
+and re-runs of the same project recompute identical work. Results are
+keyed by a BLAKE2b digest of (step, canonical inputs), so a repeat costs
+a dict lookup instead of the workpool round-trip, and concurrent
+duplicate calls coalesce onto one in-flight computation the same way
+LLMManager single-flights duplicate prompts.
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict
+
+import orjson
+
+
+def workpool_key(step: str, inputs: Dict[str, Any]) -> bytes:
+    """Deterministic digest of one workpool invocation's identity."""
+    payload = orjson.dumps(
+        {"step": step, "inputs": inputs},
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class WorkpoolCache:
+    """Coalescing result cache shared by the workflows of one coordinator."""
+
+    def __init__(self) -> None:
+        self._results: Dict[bytes, Any] = {}
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_compute(
+        self, key: bytes, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached result for ``key``, computing it at most once.
+
+        Concurrent callers for the same key await the first caller's
+        future; a failed computation propagates to all waiters and leaves
+        nothing cached, so the next attempt recomputes.
+        """
+        async with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+            existing = self._inflight.get(key)
+            if existing is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._inflight[key] = asyncio.get_running_loop().create_future()
+        if existing is not None:
+            return await existing
+
+        future = self._inflight[key]
+        try:
+            value = await factory()
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved; leader re-raises
+            raise
+        else:
+            future.set_result(value)
+            async with self._lock:
+                self._results[key] = value
+            return value
+        finally:
+            async with self._lock:
+                self._inflight.pop(key, None)
+
+    def invalidate(self) -> None:
+        """Drop all cached results (e.g. after project inputs change)."""
+        self._results.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._results),
+            "hit_rate": self.hits / total if total else 0.0,
+        }